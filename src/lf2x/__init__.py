@@ -1,32 +1,89 @@
 """Public LF2X package interface."""
 
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
 from .__about__ import __version__
-from .analyzer import FlowAnalysis, FlowPattern, TargetRecommendation, analyze_flow
-from .config import DEFAULT_OUTPUT_DIR, LF2XSettings
-from .extractors import DetectedSecret, detect_secrets
-from .ir import (
-    IntermediateRepresentation,
-    IREdge,
-    IRMetadata,
-    IRNode,
-    build_intermediate_representation,
-)
-from .parser import (
-    FlowEdge,
-    FlowMetadata,
-    FlowNode,
-    LangFlowDocument,
-    UnsupportedFlowVersionError,
-    parse_langflow_dict,
-    parse_langflow_json,
-)
-from .reporting import ConversionReport, ReportArtifacts, build_report, write_conversion_report
-from .rest_client import (
-    LangFlowAPIError,
-    LangFlowAuthError,
-    LangFlowClient,
-    LangFlowNotFoundError,
-)
+
+if TYPE_CHECKING:
+    from .analyzer import (
+        FlowAnalysis,
+        FlowPattern,
+        TargetRecommendation,
+        analyze_flow,
+        recommend_target,
+    )
+    from .config import DEFAULT_OUTPUT_DIR, LF2XSettings
+    from .extractors import DetectedSecret, detect_secrets
+    from .ir import (
+        IntermediateRepresentation,
+        IREdge,
+        IRMetadata,
+        IRNode,
+        build_intermediate_representation,
+    )
+    from .parser import (
+        FlowEdge,
+        FlowMetadata,
+        FlowNode,
+        LangFlowDocument,
+        UnsupportedFlowVersionError,
+        parse_langflow_dict,
+        parse_langflow_json,
+    )
+    from .reporting import ConversionReport, ReportArtifacts, build_report, write_conversion_report
+    from .rest_client import (
+        LangFlowAPIError,
+        LangFlowAuthError,
+        LangFlowClient,
+        LangFlowNotFoundError,
+    )
+
+# Public names resolve lazily so that light entry points (e.g. ``lf2x version``)
+# do not pay for importing HTTPX, YAML, and the generator backends up front.
+_EXPORTS: dict[str, str] = {
+    "FlowAnalysis": ".analyzer",
+    "FlowPattern": ".analyzer",
+    "TargetRecommendation": ".analyzer",
+    "analyze_flow": ".analyzer",
+    "recommend_target": ".analyzer",
+    "DEFAULT_OUTPUT_DIR": ".config",
+    "LF2XSettings": ".config",
+    "DetectedSecret": ".extractors",
+    "detect_secrets": ".extractors",
+    "IntermediateRepresentation": ".ir",
+    "IREdge": ".ir",
+    "IRMetadata": ".ir",
+    "IRNode": ".ir",
+    "build_intermediate_representation": ".ir",
+    "FlowEdge": ".parser",
+    "FlowMetadata": ".parser",
+    "FlowNode": ".parser",
+    "LangFlowDocument": ".parser",
+    "UnsupportedFlowVersionError": ".parser",
+    "parse_langflow_dict": ".parser",
+    "parse_langflow_json": ".parser",
+    "ConversionReport": ".reporting",
+    "ReportArtifacts": ".reporting",
+    "build_report": ".reporting",
+    "write_conversion_report": ".reporting",
+    "LangFlowAPIError": ".rest_client",
+    "LangFlowAuthError": ".rest_client",
+    "LangFlowClient": ".rest_client",
+    "LangFlowNotFoundError": ".rest_client",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     "__version__",
@@ -42,6 +99,7 @@ __all__ = [
     "FlowPattern",
     "TargetRecommendation",
     "analyze_flow",
+    "recommend_target",
     "IntermediateRepresentation",
     "IRNode",
     "IREdge",
@@ -0,0 +1,24 @@
+"""File output shared by the project writer and conversion reports."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+
+def write_bytes(target: Path, data: bytes) -> None:
+    """Write ``data`` to ``target``, replacing any existing contents."""
+
+    # A raw descriptor skips the buffered file object that Path.write_bytes builds.
+    fd = os.open(target, _WRITE_FLAGS, 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view) :]
+    finally:
+        os.close(fd)
+
+
+__all__ = ["write_bytes"]
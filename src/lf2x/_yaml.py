@@ -0,0 +1,21 @@
+"""YAML parsing shared by the configuration and registry loaders."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import yaml
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # pragma: no cover - PyYAML built without LibYAML
+    from yaml import SafeLoader  # type: ignore[assignment]
+
+
+def safe_load(text: str | bytes) -> Any:
+    """Parse ``text`` with LibYAML's C loader when PyYAML was built with it."""
+
+    return yaml.load(text, Loader=SafeLoader)
+
+
+__all__ = ["SafeLoader", "safe_load"]
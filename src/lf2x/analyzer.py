@@ -2,11 +2,16 @@
 
 from __future__ import annotations
 
+from array import array
 from dataclasses import dataclass
 from enum import Enum, auto
+from typing import TYPE_CHECKING
 
 from .ir import IntermediateRepresentation
 
+if TYPE_CHECKING:
+    from .parser import LangFlowDocument
+
 
 class FlowPattern(Enum):
     """High-level classification of a LangFlow graph."""
@@ -36,20 +41,12 @@ class FlowAnalysis:
 def analyze_flow(ir: IntermediateRepresentation) -> FlowAnalysis:
     """Analyze an Intermediate Representation and classify its flow pattern."""
 
-    adjacency: dict[str, set[str]] = {node.node_id: set() for node in ir.nodes}
-    indegree: dict[str, int] = {node.node_id: 0 for node in ir.nodes}
-
-    for edge in ir.edges:
-        adjacency.setdefault(edge.source, set()).add(edge.target)
-        indegree.setdefault(edge.target, 0)
-        indegree.setdefault(edge.source, 0)
-        indegree[edge.target] += 1
-
-    has_branching = any(len(targets) > 1 for targets in adjacency.values()) or any(
-        degree > 1 for degree in indegree.values()
-    )
+    adjacency, has_branching = _build_adjacency(ir)
     has_cycles = _detect_cycle(adjacency)
+    return _ANALYSES[(has_cycles, has_branching)]
 
+
+def _classify(has_cycles: bool, has_branching: bool) -> FlowAnalysis:
     if has_cycles:
         pattern = FlowPattern.CYCLIC
         recommendation = TargetRecommendation.LANGGRAPH
@@ -68,25 +65,101 @@ def analyze_flow(ir: IntermediateRepresentation) -> FlowAnalysis:
     )
 
 
-def _detect_cycle(graph: dict[str, set[str]]) -> bool:
-    visited: set[str] = set()
-    stack: set[str] = set()
-
-    def dfs(node: str) -> bool:
-        visited.add(node)
-        stack.add(node)
-        for neighbour in graph.get(node, set()):
-            if neighbour not in visited:
-                if dfs(neighbour):
-                    return True
-            elif neighbour in stack:
+# FlowAnalysis is frozen, so the four possible outcomes are built once and shared.
+_ANALYSES: dict[tuple[bool, bool], FlowAnalysis] = {
+    (has_cycles, has_branching): _classify(has_cycles, has_branching)
+    for has_cycles in (False, True)
+    for has_branching in (False, True)
+}
+
+
+def recommend_target(flow: IntermediateRepresentation | LangFlowDocument) -> TargetRecommendation:
+    """Return the recommended target, skipping cycle detection for branching flows.
+
+    Parsed documents are accepted directly so callers that only need the target
+    do not have to build an Intermediate Representation first.
+    """
+
+    adjacency, has_branching = _build_adjacency(flow)
+    if has_branching or _detect_cycle(adjacency):
+        return TargetRecommendation.LANGGRAPH
+    return TargetRecommendation.LANGCHAIN
+
+
+def _build_adjacency(
+    flow: IntermediateRepresentation | LangFlowDocument,
+) -> tuple[list[dict[int, None]], bool]:
+    index: dict[str, int] = {}
+    for node in flow.nodes:
+        index.setdefault(node.node_id, len(index))
+    # Successors live in insertion-ordered dicts, so duplicate edges are dropped in O(1).
+    adjacency: list[dict[int, None]] = [{} for _ in index]
+    indegree: list[int] = [0] * len(index)
+    has_branching = False
+
+    for edge in flow.edges:
+        source = _node_index(edge.source, index, adjacency, indegree)
+        target = _node_index(edge.target, index, adjacency, indegree)
+        targets = adjacency[source]
+        targets[target] = None
+        indegree[target] += 1
+        if not has_branching and (len(targets) > 1 or indegree[target] > 1):
+            has_branching = True
+
+    return adjacency, has_branching
+
+
+def _node_index(
+    node_id: str,
+    index: dict[str, int],
+    adjacency: list[dict[int, None]],
+    indegree: list[int],
+) -> int:
+    position = index.get(node_id)
+    if position is None:
+        # Edges may reference nodes that are absent from the node list.
+        position = index[node_id] = len(adjacency)
+        adjacency.append({})
+        indegree.append(0)
+    return position
+
+
+# DFS colours. A _DONE node's descendants were fully explored without finding a
+# back edge, so walks from later roots stop there instead of re-walking them.
+_UNVISITED, _IN_PROGRESS, _DONE = 0, 1, 2
+
+
+def _detect_cycle(graph: list[dict[int, None]]) -> bool:
+    # Flatten to CSR form: node i's successors are indices[indptr[i]:indptr[i + 1]].
+    indptr = array("i", [0])
+    indices = array("i")
+    for targets in graph:
+        indices.extend(targets)
+        indptr.append(len(indices))
+
+    colour = bytearray(len(graph))
+    cursor = array("i", indptr)
+    stack = array("i")
+    for root in range(len(graph)):
+        if colour[root] != _UNVISITED:
+            continue
+        colour[root] = _IN_PROGRESS
+        stack.append(root)
+        while stack:
+            node = stack[-1]
+            position = cursor[node]
+            if position == indptr[node + 1]:
+                stack.pop()
+                colour[node] = _DONE
+                continue
+            cursor[node] = position + 1
+            neighbour = indices[position]
+            state = colour[neighbour]
+            if state == _IN_PROGRESS:
                 return True
-        stack.remove(node)
-        return False
-
-    for node in graph:
-        if node not in visited and dfs(node):
-            return True
+            if state == _UNVISITED:
+                colour[neighbour] = _IN_PROGRESS
+                stack.append(neighbour)
     return False
 
 
@@ -95,4 +168,5 @@ __all__ = [
     "FlowPattern",
     "TargetRecommendation",
     "analyze_flow",
+    "recommend_target",
 ]
@@ -1,42 +1,83 @@
 """Typer-based command line entry point."""
 
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 import typer
 from typer.models import OptionInfo
 
-from . import DEFAULT_OUTPUT_DIR, LF2XSettings, __version__
-from .analyzer import analyze_flow
-from .converter import convert_flow
-from .ir import build_intermediate_representation
-from .parser import parse_langflow_json
+from .__about__ import __version__
+
+if TYPE_CHECKING:
+    from .config import LF2XSettings
+
+# Mirrors config.DEFAULT_OUTPUT_DIR; config pulls in YAML, so it is imported only by
+# the commands that resolve settings.
+_DEFAULT_OUTPUT_DIR = "dist"
 
 app = typer.Typer(add_completion=False, help="LangFlow to X (LF2X) developer tools")
 
+_SOURCE_ARGUMENT = typer.Argument(..., help="Path to a LangFlow JSON export")
+
+
+def _output_dir_option(help_text: str) -> Any:
+    # Each command describes --output-dir differently, so only the help text varies.
+    return typer.Option(_DEFAULT_OUTPUT_DIR, "--output-dir", help=help_text, show_default=True)
+
 
-def _derive_search_paths(config_path: Path | None) -> list[Path] | None:
+_CONFIGURE_OUTPUT_DIR_OPTION = _output_dir_option("Directory for generated artifacts")
+_CONVERT_OUTPUT_DIR_OPTION = _output_dir_option(
+    "Directory where generated artifacts will be written"
+)
+_ANALYZE_OUTPUT_DIR_OPTION = _output_dir_option("Output directory used to resolve IR metadata")
+_CONFIG_OPTION = typer.Option(
+    "",
+    "--config",
+    help="Optional path to lf2x.yaml configuration file",
+)
+_OVERWRITE_OPTION = typer.Option(
+    False,
+    "--overwrite",
+    help="Allow overwriting existing files when regenerating projects",
+)
+
+
+def _derive_search_paths(config_path: Path | None, cwd: Path) -> list[Path] | None:
     if config_path is None:
         return None
     parent = config_path.parent if config_path.suffix else config_path
-    return [parent, Path.cwd()]
+    return [parent, cwd]
 
 
 def _normalize_option(value: str | OptionInfo | None) -> str | None:
-    if value is None:
-        return None
-    if isinstance(value, OptionInfo):
+    # Direct function calls (e.g. from tests) receive the OptionInfo default itself.
+    if value is None or isinstance(value, OptionInfo):
         return None
     return value or None
 
 
-def _build_settings(*, output_value: str | None, config_value: str | None) -> LF2XSettings:
-    config_path = Path(config_value) if config_value else None
-    search_paths = _derive_search_paths(config_path)
-    return LF2XSettings.from_sources(
-        output_dir=output_value,
+def _build_settings(
+    *, output_value: str | OptionInfo | None, config_value: str | OptionInfo | None
+) -> "LF2XSettings":
+    from .config import LF2XSettings
+
+    # Snapshot the working directory once; the output directory is anchored to it
+    # so later resolve_output_dir() calls in this invocation skip getcwd().
+    cwd = Path.cwd()
+    config_override = _normalize_option(config_value)
+    config_path = Path(config_override) if config_override else None
+    search_paths = _derive_search_paths(config_path, cwd)
+    settings = LF2XSettings.from_sources(
+        output_dir=_normalize_option(output_value),
         config_file=config_path,
         search_paths=search_paths,
     )
+    return settings.with_overrides(output_dir=settings.resolve_output_dir(base_dir=cwd))
+
+
+def _echo_lines(*lines: str) -> None:
+    # One write per command instead of one per line.
+    typer.echo("\n".join(lines))
 
 
 @app.command()
@@ -48,126 +89,98 @@ def version() -> None:
 
 @app.command()
 def configure(
-    output_dir: str = typer.Option(
-        str(DEFAULT_OUTPUT_DIR),
-        "--output-dir",
-        help="Directory for generated artifacts",
-        show_default=True,
-    ),
-    config: str = typer.Option(
-        "",
-        "--config",
-        help="Optional path to lf2x.yaml configuration file",
-    ),
+    output_dir: str = _CONFIGURE_OUTPUT_DIR_OPTION,
+    config: str = _CONFIG_OPTION,
 ) -> None:
     """Show the resolved configuration for the current invocation."""
 
-    output_override = _normalize_option(output_dir)
-    config_override = _normalize_option(config)
-    settings = _build_settings(output_value=output_override, config_value=config_override)
+    settings = _build_settings(output_value=output_dir, config_value=config)
     resolved_dir = settings.resolve_output_dir()
-    typer.echo(f"output_dir={resolved_dir}")
-    typer.echo(
-        f"config_file={settings.config_file}" if settings.config_file else "config_file=<none>"
+    _echo_lines(
+        f"output_dir={resolved_dir}",
+        f"config_file={settings.config_file}" if settings.config_file else "config_file=<none>",
+        f"api_base_url={settings.api_base_url or '<none>'}",
+        "api_token=<provided>" if settings.api_token else "api_token=<none>",
     )
-    typer.echo(f"api_base_url={settings.api_base_url or '<none>'}")
-    typer.echo("api_token=<provided>" if settings.api_token else "api_token=<none>")
 
 
 @app.command()
 def convert(
-    source: str = typer.Argument(..., help="Path to a LangFlow JSON export"),
-    output_dir: str = typer.Option(
-        str(DEFAULT_OUTPUT_DIR),
-        "--output-dir",
-        help="Directory where generated artifacts will be written",
-        show_default=True,
-    ),
-    config: str = typer.Option(
-        "",
-        "--config",
-        help="Optional path to lf2x.yaml configuration file",
-    ),
-    overwrite: bool = typer.Option(
-        False,
-        "--overwrite",
-        help="Allow overwriting existing files when regenerating projects",
-    ),
+    source: str = _SOURCE_ARGUMENT,
+    output_dir: str = _CONVERT_OUTPUT_DIR_OPTION,
+    config: str = _CONFIG_OPTION,
+    overwrite: bool = _OVERWRITE_OPTION,
 ) -> None:
     """Convert a LangFlow export into a code project."""
 
-    output_override = _normalize_option(output_dir)
-    config_override = _normalize_option(config)
-    settings = _build_settings(output_value=output_override, config_value=config_override)
+    from .converter import convert_flow
+
+    settings = _build_settings(output_value=output_dir, config_value=config)
 
     result = convert_flow(source, settings=settings, overwrite=overwrite)
-    typer.echo(f"flow_id={result.flow_id}")
-    typer.echo(f"target={result.target.value}")
-    typer.echo(f"project_root={result.project_root}")
-    typer.echo(f"package={result.package_name}")
     created = sum(1 for entry in result.writes if entry.status in {"created", "would-create"})
     updated = sum(1 for entry in result.writes if entry.status in {"updated", "would-update"})
-    typer.echo(f"files_created={created}")
-    typer.echo(f"files_updated={updated}")
-    typer.echo(f"report_markdown={result.report_markdown}")
-    typer.echo(f"report_json={result.report_json}")
+    _echo_lines(
+        f"flow_id={result.flow_id}",
+        f"target={result.target.value}",
+        f"project_root={result.project_root}",
+        f"package={result.package_name}",
+        f"files_created={created}",
+        f"files_updated={updated}",
+        f"report_markdown={result.report_markdown}",
+        f"report_json={result.report_json}",
+    )
 
 
 @app.command()
 def analyze(
-    source: str = typer.Argument(..., help="Path to a LangFlow JSON export"),
-    output_dir: str = typer.Option(
-        str(DEFAULT_OUTPUT_DIR),
-        "--output-dir",
-        help="Output directory used to resolve IR metadata",
-        show_default=True,
-    ),
-    config: str = typer.Option(
-        "",
-        "--config",
-        help="Optional path to lf2x.yaml configuration file",
-    ),
+    source: str = _SOURCE_ARGUMENT,
+    output_dir: str = _ANALYZE_OUTPUT_DIR_OPTION,
+    config: str = _CONFIG_OPTION,
 ) -> None:
     """Analyze a LangFlow export and report structural characteristics."""
 
-    output_override = _normalize_option(output_dir)
-    config_override = _normalize_option(config)
-    settings = _build_settings(output_value=output_override, config_value=config_override)
+    from .analyzer import analyze_flow
+    from .ir import build_intermediate_representation
+    from .parser import parse_langflow_json
+
+    settings = _build_settings(output_value=output_dir, config_value=config)
     document = parse_langflow_json(source, settings=settings)
     ir = build_intermediate_representation(document)
     analysis = analyze_flow(ir)
-    typer.echo(f"flow_id={ir.flow_id}")
-    typer.echo(f"name={ir.name}")
-    typer.echo(f"pattern={analysis.pattern.name.lower()}")
-    typer.echo(f"recommended_target={analysis.recommended_target.value}")
-    typer.echo(f"has_cycles={str(analysis.has_cycles).lower()}")
-    typer.echo(f"has_branching={str(analysis.has_branching).lower()}")
-    typer.echo(f"node_count={len(ir.nodes)}")
-    typer.echo(f"edge_count={len(ir.edges)}")
-    typer.echo(f"output_dir={settings.resolve_output_dir()}")
+    _echo_lines(
+        f"flow_id={ir.flow_id}",
+        f"name={ir.name}",
+        f"pattern={analysis.pattern.name.lower()}",
+        f"recommended_target={analysis.recommended_target.value}",
+        f"has_cycles={str(analysis.has_cycles).lower()}",
+        f"has_branching={str(analysis.has_branching).lower()}",
+        f"node_count={len(ir.nodes)}",
+        f"edge_count={len(ir.edges)}",
+        f"output_dir={settings.resolve_output_dir()}",
+    )
 
 
 @app.command()
 def validate(
-    source: str = typer.Argument(..., help="Path to a LangFlow JSON export"),
-    config: str = typer.Option(
-        "",
-        "--config",
-        help="Optional path to lf2x.yaml configuration file",
-    ),
+    source: str = _SOURCE_ARGUMENT,
+    config: str = _CONFIG_OPTION,
 ) -> None:
     """Validate that a LangFlow export can be parsed and analyzed."""
 
-    config_override = _normalize_option(config)
-    settings = _build_settings(output_value=None, config_value=config_override)
+    from .analyzer import recommend_target
+    from .parser import parse_langflow_json
+
+    settings = _build_settings(output_value=None, config_value=config)
     document = parse_langflow_json(source, settings=settings)
-    ir = build_intermediate_representation(document)
-    analysis = analyze_flow(ir)
-    typer.echo(f"flow_id={ir.flow_id}")
-    typer.echo("valid=true")
-    typer.echo(f"node_count={len(ir.nodes)}")
-    typer.echo(f"edge_count={len(ir.edges)}")
-    typer.echo(f"recommended_target={analysis.recommended_target.value}")
+    target = recommend_target(document)
+    _echo_lines(
+        f"flow_id={document.flow_id}",
+        "valid=true",
+        f"node_count={len(document.nodes)}",
+        f"edge_count={len(document.edges)}",
+        f"recommended_target={target.value}",
+    )
 
 
 if __name__ == "__main__":
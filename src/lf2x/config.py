@@ -2,16 +2,24 @@
 
 from __future__ import annotations
 
+import os
 from collections.abc import Iterable, Mapping
 from dataclasses import dataclass
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
 import yaml
 
+from ._yaml import safe_load
+
 DEFAULT_OUTPUT_DIR = Path("dist")
 CONFIG_FILENAME = "lf2x.yaml"
 
+# Parsed configuration documents keyed by (path, mtime_ns, size). Editing a file
+# changes its key, and the previous entry for that path is evicted on reload.
+_CONFIG_CACHE: dict[tuple[str, int, int], Mapping[str, Any]] = {}
+
 
 @dataclass(slots=True, frozen=True)
 class LF2XSettings:
@@ -25,9 +33,11 @@ class LF2XSettings:
     def resolve_output_dir(self, base_dir: Path | None = None) -> Path:
         """Return the absolute output directory without mutating filesystem."""
 
-        base = base_dir if base_dir is not None else Path.cwd()
         candidate = self.output_dir
-        return candidate if candidate.is_absolute() else base / candidate
+        if os.path.isabs(candidate):
+            return candidate
+        base = base_dir if base_dir is not None else os.getcwd()
+        return Path(os.path.join(base, candidate))
 
     def with_overrides(
         self,
@@ -105,22 +115,41 @@ def _select_config_path(
     if search_paths is None:
         return None
     for location in search_paths:
-        candidate = location / CONFIG_FILENAME
-        if candidate.exists():
-            return candidate
+        candidate = os.path.join(location, CONFIG_FILENAME)
+        if os.path.isfile(candidate):
+            return Path(candidate)
     return None
 
 
-def _load_config(config_path: Path) -> dict[str, Any]:
+def _load_config(config_path: Path) -> Mapping[str, Any]:
+    stat = config_path.stat()
+    key = (str(config_path), stat.st_mtime_ns, stat.st_size)
+    cached = _CONFIG_CACHE.get(key)
+    if cached is not None:
+        return cached
     try:
-        data = yaml.safe_load(config_path.read_text())
+        data = safe_load(config_path.read_text())
     except yaml.YAMLError as exc:  # pragma: no cover - defensive
         raise ValueError(f"Failed to parse configuration file {config_path}") from exc
     if data is None:
-        return {}
+        data = {}
     if not isinstance(data, Mapping):
         raise ValueError(f"Configuration file {config_path} must contain a mapping")
-    return dict(data)
+    frozen: Mapping[str, Any] = MappingProxyType({k: _freeze(v) for k, v in data.items()})
+    for stale in [entry for entry in _CONFIG_CACHE if entry[0] == key[0]]:
+        del _CONFIG_CACHE[stale]
+    _CONFIG_CACHE[key] = frozen
+    return frozen
+
+
+def _freeze(value: Any) -> Any:
+    """Return a read-only view of parsed config data so cached documents can be shared."""
+
+    if isinstance(value, Mapping):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
 
 
 def _config_output_dir(data: Mapping[str, Any]) -> Path | None:
@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+import re
+import sys
 from dataclasses import dataclass
+from functools import lru_cache
 
 from ..ir import IntermediateRepresentation
 from ..naming import slugify
@@ -16,6 +19,12 @@ _SECRET_HINTS = (
     "auth",
     "key",
 )
+_SECRET_HINT_SET = frozenset(_SECRET_HINTS)
+# All hints in one case-insensitive alternation so each field name is scanned once
+# by the C regex engine, without allocating a lowered copy first.
+_SECRET_HINT_PATTERN = re.compile(
+    "|".join(re.escape(hint) for hint in _SECRET_HINTS), re.IGNORECASE
+)
 
 
 @dataclass(frozen=True, slots=True)
@@ -32,21 +41,37 @@ class DetectedSecret:
 def detect_secrets(ir: IntermediateRepresentation) -> tuple[DetectedSecret, ...]:
     """Return a collection of secrets detected in the IR."""
 
+    # One scan over every field name rules out flows with nothing secret-looking;
+    # hints never contain a newline, so a match cannot straddle two names.
+    field_names = "\n".join([field for node in ir.nodes for field in node.data])
+    if _SECRET_HINT_PATTERN.search(field_names) is None:
+        return ()
+
     secrets: list[DetectedSecret] = []
     seen: set[str] = set()
+    # Bind hot lookups once; this loop runs for every field of every node.
+    flow_id = ir.flow_id
+    looks_like_secret = _looks_like_secret
+    env_var_name = _env_var_name
+    attribute_name = _attribute_name
+    append = secrets.append
+    mark_seen = seen.add
     for node in ir.nodes:
+        node_id = node.node_id
         for field, value in node.data.items():
-            if not _looks_like_secret(field, value):
+            if not looks_like_secret(field, value):
                 continue
-            env_var = _env_var_name(ir.flow_id, node.node_id, field)
-            if env_var in seen:
+            env_var = env_var_name(flow_id, node_id, field)
+            # A single hash lookup: the set only grows when env_var is new.
+            before = len(seen)
+            mark_seen(env_var)
+            if len(seen) == before:
                 continue
-            seen.add(env_var)
-            secrets.append(
+            append(
                 DetectedSecret(
                     env_var=env_var,
-                    attribute=_attribute_name(env_var),
-                    source_node=node.node_id,
+                    attribute=attribute_name(env_var),
+                    source_node=node_id,
                     field=field,
                     raw_value=value if isinstance(value, str) else None,
                 )
@@ -55,21 +80,28 @@ def detect_secrets(ir: IntermediateRepresentation) -> tuple[DetectedSecret, ...]
 
 
 def _looks_like_secret(field: str, value: object) -> bool:
-    if not isinstance(value, str):
-        return False
-    if not value.strip():
+    if not isinstance(value, str) or not value or value.isspace():
         return False
-    lower_field = field.lower()
-    return any(hint in lower_field for hint in _SECRET_HINTS)
+    # Exact hint names such as ``api_key`` are the common case; skip the cached call.
+    return field in _SECRET_HINT_SET or _is_secret_field(field)
+
+
+# Field names repeat across nodes (``api_key``, ``model_name``, ...), so each
+# distinct name is matched against the hint pattern only once.
+@lru_cache(maxsize=4096)
+def _is_secret_field(field: str) -> bool:
+    return _SECRET_HINT_PATTERN.search(field) is not None
 
 
+@lru_cache(maxsize=4096)
 def _env_var_name(flow_id: str, node_id: str, field: str) -> str:
     slug = slugify(f"{flow_id}_{node_id}_{field}", default="lf2x_secret")
-    return slug.upper()
+    return sys.intern(slug.upper())
 
 
+@lru_cache(maxsize=4096)
 def _attribute_name(env_var: str) -> str:
-    return slugify(env_var.lower(), default="secret")
+    return sys.intern(slugify(env_var.lower(), default="secret"))
 
 
 __all__ = ["DetectedSecret", "detect_secrets"]
@@ -0,0 +1,141 @@
+"""Renderers shared by the LangChain and LangGraph generators."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Sequence
+
+from ..extractors import DetectedSecret
+from ..ir import IntermediateRepresentation
+from .project import GeneratedFile
+
+FilesKey = tuple[
+    str,
+    str,
+    str,
+    tuple[str, ...],
+    tuple[tuple[str, str], ...],
+    tuple[tuple[str, str, str, str], ...],
+]
+FilesRenderer = Callable[
+    [str, IntermediateRepresentation, tuple[DetectedSecret, ...]], tuple[GeneratedFile, ...]
+]
+_FILES_CACHE_SIZE = 32
+
+
+def cached_files(
+    cache: dict[FilesKey, tuple[GeneratedFile, ...]],
+    render: FilesRenderer,
+    package_name: str,
+    ir: IntermediateRepresentation,
+    secrets: tuple[DetectedSecret, ...],
+) -> tuple[GeneratedFile, ...]:
+    """Return the rendered files for a flow, reusing ``cache`` when possible."""
+
+    # Keyed on exactly the IR fields the renderers read, so repeated runs on the
+    # same flow skip template rendering entirely. Secret values never enter the key.
+    key: FilesKey = (
+        package_name,
+        ir.flow_id,
+        ir.name,
+        ir.ordered_node_ids(),
+        ir.edge_pairs(),
+        tuple(
+            [
+                (secret.env_var, secret.attribute, secret.source_node, secret.field)
+                for secret in secrets
+            ]
+        ),
+    )
+    files = cache.get(key)
+    if files is None:
+        files = render(package_name, ir, secrets)
+        if len(cache) >= _FILES_CACHE_SIZE:
+            del cache[next(iter(cache))]
+        cache[key] = files
+    return files
+
+
+def is_plain_literal(text: str) -> bool:
+    """Return True when ``repr(text)`` is ``text`` wrapped in single quotes."""
+
+    return text.isascii() and text.isprintable() and "'" not in text and "\\" not in text
+
+
+def join_literals(values: Sequence[str], separator: str) -> str:
+    """Join ``values`` as Python string literals, matching ``repr`` output."""
+
+    if not values:
+        return ""
+    if is_plain_literal("".join(values)):
+        return "'" + f"'{separator}'".join(values) + "'"
+    return separator.join(map(repr, values))
+
+
+def render_config_init() -> bytes:
+    """Return the generated ``config/__init__.py`` module."""
+
+    return b"from .settings import settings\n"
+
+
+def render_config_settings(
+    template: str,
+    default: str,
+    secrets: tuple[DetectedSecret, ...],
+) -> str:
+    """Render ``config/settings.py`` with one field per detected secret."""
+
+    if not secrets:
+        return default
+
+    field_lines: list[str] = []
+    assignment_lines: list[str] = []
+    for secret in secrets:
+        attribute = secret.attribute
+        field_lines.append(f"    {attribute}: str | None")
+        assignment_lines.append(f"        {attribute}=os.getenv('{secret.env_var}'),")
+    return template.format(
+        field_lines="\n".join(field_lines),
+        assignment_lines="\n".join(assignment_lines),
+    )
+
+
+def render_env_example(secrets: tuple[DetectedSecret, ...]) -> str:
+    """Render ``.env.example`` listing every detected secret."""
+
+    if not secrets:
+        return "# No secrets detected in the flow. Add environment variables as needed.\n"
+
+    entries = (
+        f"# Source: node {secret.source_node}, field {secret.field}\n{secret.env_var}="
+        for secret in secrets
+    )
+    return "\n".join(["# Populate these secrets before deploying.", *entries, ""])
+
+
+def render_unit_test_config(
+    template: str,
+    package_name: str,
+    secrets: tuple[DetectedSecret, ...],
+) -> str:
+    """Render the settings unit test, asserting each secret attribute exists."""
+
+    fields_assertion = "\n    ".join(
+        [f"assert hasattr(settings, '{secret.attribute}')" for secret in secrets]
+    )
+    body = template.format(package_name=package_name)
+    if fields_assertion:
+        body += f"\n    {fields_assertion}"
+    return body + "\n"
+
+
+__all__ = [
+    "FilesKey",
+    "FilesRenderer",
+    "cached_files",
+    "is_plain_literal",
+    "join_literals",
+    "render_config_init",
+    "render_config_settings",
+    "render_env_example",
+    "render_unit_test_config",
+]
@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import textwrap
-from collections.abc import Iterable
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -11,6 +10,15 @@ from ..analyzer import FlowPattern, analyze_flow
 from ..extractors import DetectedSecret, detect_secrets
 from ..ir import IntermediateRepresentation
 from ..naming import slugify
+from ._common import (
+    FilesKey,
+    cached_files,
+    join_literals,
+    render_config_init,
+    render_config_settings,
+    render_env_example,
+    render_unit_test_config,
+)
 from .project import GeneratedFile, ProjectScaffoldWriter, WriteResult
 
 SUPPORTED_PATTERN = FlowPattern.LINEAR
@@ -24,6 +32,7 @@ class LangChainProject:
     package_name: str
     flow_id: str
     writes: tuple[WriteResult, ...]
+    files: tuple[GeneratedFile, ...]
 
 
 def generate_langchain_project(
@@ -45,118 +54,133 @@ def generate_langchain_project(
     package_name = slugify(ir.name or ir.flow_id, default="lf2x_project")
     writer = ProjectScaffoldWriter(root, overwrite=overwrite)
     secrets = detect_secrets(ir)
-    writes = writer.write_files(_build_files(package_name, ir, secrets))
+    files = _build_files(package_name, ir, secrets)
+    writes = writer.write_files(files)
 
     return LangChainProject(
         root=root,
         package_name=package_name,
         flow_id=ir.flow_id,
         writes=tuple(writes),
+        files=files,
     )
 
 
+_FILES_CACHE: dict[FilesKey, tuple[GeneratedFile, ...]] = {}
+
+
 def _build_files(
     package_name: str,
     ir: IntermediateRepresentation,
-    secrets: Iterable[DetectedSecret],
-) -> Iterable[GeneratedFile]:
-    detected = tuple(secrets)
-    yield GeneratedFile(Path("pyproject.toml"), _render_pyproject(package_name))
-    yield GeneratedFile(
-        Path("src") / package_name / "__init__.py",
-        "__all__ = ['build_chain', 'run_chain']\n",
-    )
-    yield GeneratedFile(
-        Path("src") / package_name / "chains" / "__init__.py",
-        "from .main_chain import build_chain, run_chain\n",
-    )
-    yield GeneratedFile(
-        Path("src") / package_name / "chains" / "main_chain.py",
-        _render_main_chain(ir),
-    )
-    yield GeneratedFile(
-        Path("src") / package_name / "nodes" / "__init__.py",
-        _render_nodes_init(),
-        todos=("Populate node factories for the generated flow",),
-    )
-    yield GeneratedFile(
-        Path("src") / package_name / "prompts" / "__init__.py",
-        _render_prompts_init(),
-        todos=("Replace prompt registry with project-specific prompts",),
-    )
-    yield GeneratedFile(
-        Path("src") / package_name / "prompts" / "system_prompt.txt",
-        _render_prompt_stub(ir),
-        todos=("Author the system prompt for this flow",),
-    )
-    yield GeneratedFile(
-        Path("src") / package_name / "tools" / "__init__.py",
-        _render_tools_init(),
-        todos=("Wire LangFlow tools into executable adapters",),
-    )
-    yield GeneratedFile(
-        Path("src") / package_name / "tools" / "base_tool.py",
-        _render_tool_stub(),
-    )
-    yield GeneratedFile(
-        Path("src") / package_name / "config" / "__init__.py",
-        _render_config_init(),
-    )
-    yield GeneratedFile(
-        Path("src") / package_name / "config" / "settings.py",
-        _render_config_settings(detected),
-        todos=("Map generated components to real configuration values",),
-    )
-    yield GeneratedFile(
-        Path("src") / package_name / "cli.py",
-        _render_cli_module(package_name),
-        todos=("Extend CLI commands to match production needs",),
-    )
-    yield GeneratedFile(
-        Path("tests") / "smoke" / "test_flow.py",
-        _render_smoke_test(package_name, ir),
-    )
-    yield GeneratedFile(
-        Path("tests") / "unit" / "test_config.py",
-        _render_unit_test_config(package_name, detected),
-    )
-    yield GeneratedFile(
-        Path("tests") / "unit" / "test_cli.py",
-        _render_unit_test_cli(package_name),
-    )
-    yield GeneratedFile(Path("README.md"), _render_readme(ir))
-    yield GeneratedFile(
-        Path(".env.example"),
-        _render_env_example(detected),
-        todos=("Set real secret values for deployment",),
-    )
+    secrets: tuple[DetectedSecret, ...],
+) -> tuple[GeneratedFile, ...]:
+    return cached_files(_FILES_CACHE, _render_files, package_name, ir, secrets)
 
 
-def _render_pyproject(package_name: str) -> str:
+def _render_files(
+    package_name: str,
+    ir: IntermediateRepresentation,
+    secrets: tuple[DetectedSecret, ...],
+) -> tuple[GeneratedFile, ...]:
     return (
-        textwrap.dedent(
-            """
-            [build-system]
-            requires = ["setuptools>=68"]
-            build-backend = "setuptools.build_meta"
-
-            [project]
-            name = "{project_name}"
-            version = "0.0.0"
-            description = "Auto-generated LangChain project"
-            requires-python = ">=3.11"
-            dependencies = ["langchain>=0.1"]
-            """
-        )
-        .strip()
-        .format(project_name=package_name.replace("_", "-"))
-        + "\n"
+        GeneratedFile("pyproject.toml", _render_pyproject(package_name)),
+        GeneratedFile(
+            f"src/{package_name}/__init__.py",
+            "__all__ = ['build_chain', 'run_chain']\n",
+        ),
+        GeneratedFile(
+            f"src/{package_name}/chains/__init__.py",
+            "from .main_chain import build_chain, run_chain\n",
+        ),
+        GeneratedFile(
+            f"src/{package_name}/chains/main_chain.py",
+            _render_main_chain(ir),
+        ),
+        GeneratedFile(
+            f"src/{package_name}/nodes/__init__.py",
+            _render_nodes_init(),
+            todos=("Populate node factories for the generated flow",),
+        ),
+        GeneratedFile(
+            f"src/{package_name}/prompts/__init__.py",
+            _render_prompts_init(),
+            todos=("Replace prompt registry with project-specific prompts",),
+        ),
+        GeneratedFile(
+            f"src/{package_name}/prompts/system_prompt.txt",
+            _render_prompt_stub(ir),
+            todos=("Author the system prompt for this flow",),
+        ),
+        GeneratedFile(
+            f"src/{package_name}/tools/__init__.py",
+            _render_tools_init(),
+            todos=("Wire LangFlow tools into executable adapters",),
+        ),
+        GeneratedFile(
+            f"src/{package_name}/tools/base_tool.py",
+            _render_tool_stub(),
+        ),
+        GeneratedFile(
+            f"src/{package_name}/config/__init__.py",
+            render_config_init(),
+        ),
+        GeneratedFile(
+            f"src/{package_name}/config/settings.py",
+            render_config_settings(_CONFIG_SETTINGS_TEMPLATE, _DEFAULT_CONFIG_SETTINGS, secrets),
+            todos=("Map generated components to real configuration values",),
+        ),
+        GeneratedFile(
+            f"src/{package_name}/cli.py",
+            _render_cli_module(package_name),
+            todos=("Extend CLI commands to match production needs",),
+        ),
+        GeneratedFile(
+            "tests/smoke/test_flow.py",
+            _render_smoke_test(package_name, ir),
+        ),
+        GeneratedFile(
+            "tests/unit/test_config.py",
+            render_unit_test_config(_UNIT_TEST_CONFIG_TEMPLATE, package_name, secrets),
+        ),
+        GeneratedFile(
+            "tests/unit/test_cli.py",
+            _render_unit_test_cli(package_name),
+        ),
+        GeneratedFile("README.md", _render_readme(ir)),
+        GeneratedFile(
+            ".env.example",
+            render_env_example(secrets),
+            todos=("Set real secret values for deployment",),
+        ),
     )
 
 
-def _render_main_chain(ir: IntermediateRepresentation) -> str:
-    nodes_literal = ",\n        ".join(repr(node.node_id) for node in ir.nodes)
-    template = textwrap.dedent('''
+_PYPROJECT_TEMPLATE = (
+    textwrap.dedent(
+        """
+        [build-system]
+        requires = ["setuptools>=68"]
+        build-backend = "setuptools.build_meta"
+
+        [project]
+        name = "{project_name}"
+        version = "0.0.0"
+        description = "Auto-generated LangChain project"
+        requires-python = ">=3.11"
+        dependencies = ["langchain>=0.1"]
+        """
+    ).strip()
+    + "\n"
+)
+
+
+def _render_pyproject(package_name: str) -> str:
+    return _PYPROJECT_TEMPLATE.format(project_name=package_name.replace("_", "-"))
+
+
+_MAIN_CHAIN_TEMPLATE = (
+    textwrap.dedent(
+        '''
         """LangChain chain stub generated from flow {flow_id}."""
 
         from typing import Any, List
@@ -178,27 +202,36 @@ def _render_main_chain(ir: IntermediateRepresentation) -> str:
             if debug:
                 print("Running chain with message:", message)
             return {{"message": message}}
-        ''')
-    return template.strip().format(flow_id=ir.flow_id, nodes=nodes_literal) + "\n"
+        '''
+    ).strip()
+    + "\n"
+)
 
 
-def _render_nodes_init() -> str:
-    return (
-        textwrap.dedent(
-            '''
+def _render_main_chain(ir: IntermediateRepresentation) -> str:
+    nodes_literal = join_literals(ir.ordered_node_ids(), ",\n        ")
+    return _MAIN_CHAIN_TEMPLATE.format(flow_id=ir.flow_id, nodes=nodes_literal)
+
+
+_NODES_INIT = (
+    textwrap.dedent(
+        '''
         """Node placeholders for the generated flow."""
 
         __all__: list[str] = []
         '''
-        ).strip()
-        + "\n"
-    )
+    ).strip()
+    + "\n"
+).encode("utf-8")
 
 
-def _render_prompts_init() -> str:
-    return (
-        textwrap.dedent(
-            '''
+def _render_nodes_init() -> bytes:
+    return _NODES_INIT
+
+
+_PROMPTS_INIT = (
+    textwrap.dedent(
+        '''
         """Prompt registry for the generated chain."""
 
         from pathlib import Path
@@ -211,28 +244,33 @@ def _render_prompts_init() -> str:
 
             return (PROMPT_DIR / "system_prompt.txt").read_text(encoding="utf-8")
         '''
-        ).strip()
-        + "\n"
-    )
+    ).strip()
+    + "\n"
+).encode("utf-8")
 
 
-def _render_prompt_stub(ir: IntermediateRepresentation) -> str:
-    name = ir.name or ir.flow_id
-    return (
-        textwrap.dedent(
-            f"""
+def _render_prompts_init() -> bytes:
+    return _PROMPTS_INIT
+
+
+_PROMPT_STUB_TEMPLATE = (
+    textwrap.dedent(
+        """
         You are the orchestrator for the LangFlow-derived project "{name}".
         Tailor this prompt to steer the chain behaviour.
         """
-        ).strip()
-        + "\n"
-    )
+    ).strip()
+    + "\n"
+)
 
 
-def _render_tools_init() -> str:
-    return (
-        textwrap.dedent(
-            '''
+def _render_prompt_stub(ir: IntermediateRepresentation) -> str:
+    return _PROMPT_STUB_TEMPLATE.format(name=ir.name or ir.flow_id)
+
+
+_TOOLS_INIT = (
+    textwrap.dedent(
+        '''
         """Tool adapters for connecting LangFlow tools to LangChain."""
 
         from typing import Any
@@ -249,15 +287,18 @@ def _render_tools_init() -> str:
 
             raise KeyError(name)
         '''
-        ).strip()
-        + "\n"
-    )
+    ).strip()
+    + "\n"
+).encode("utf-8")
 
 
-def _render_tool_stub() -> str:
-    return (
-        textwrap.dedent(
-            '''
+def _render_tools_init() -> bytes:
+    return _TOOLS_INIT
+
+
+_TOOL_STUB = (
+    textwrap.dedent(
+        '''
         """Base class for custom LangChain tool implementations."""
 
         from abc import ABC, abstractmethod
@@ -275,23 +316,18 @@ def _render_tool_stub() -> str:
 
                 raise NotImplementedError
         '''
-        ).strip()
-        + "\n"
-    )
+    ).strip()
+    + "\n"
+).encode("utf-8")
 
 
-def _render_config_init() -> str:
-    return "from .settings import settings\n"
+def _render_tool_stub() -> bytes:
+    return _TOOL_STUB
 
 
-def _render_config_settings(secrets: tuple[DetectedSecret, ...]) -> str:
-    if secrets:
-        field_lines = "\n".join(f"            {secret.attribute}: str | None" for secret in secrets)
-        assignment_lines = "\n".join(
-            f"                {secret.attribute}=os.getenv('{secret.env_var}'),"
-            for secret in secrets
-        )
-        template = f'''
+_CONFIG_SETTINGS_TEMPLATE = (
+    textwrap.dedent(
+        '''
         """Runtime settings for the generated LangChain project."""
 
         from __future__ import annotations
@@ -304,24 +340,26 @@ def _render_config_settings(secrets: tuple[DetectedSecret, ...]) -> str:
         class Settings:
             """Container for environment-driven configuration."""
 
-{field_lines}
+        {field_lines}
 
 
         def load_settings() -> Settings:
             """Load configuration from environment variables."""
 
             return Settings(
-{assignment_lines}
+        {assignment_lines}
             )
 
 
         settings = load_settings()
         '''
-        return textwrap.dedent(template).strip() + "\n"
+    ).strip()
+    + "\n"
+)
 
-    return (
-        textwrap.dedent(
-            '''
+_DEFAULT_CONFIG_SETTINGS = (
+    textwrap.dedent(
+        '''
         """Runtime settings for the generated LangChain project."""
 
         from __future__ import annotations
@@ -345,26 +383,14 @@ def _render_config_settings(secrets: tuple[DetectedSecret, ...]) -> str:
 
         settings = load_settings()
         '''
-        ).strip()
-        + "\n"
-    )
-
-
-def _render_env_example(secrets: tuple[DetectedSecret, ...]) -> str:
-    if not secrets:
-        return "# No secrets detected in the flow. Add environment variables as needed.\n"
-
-    lines: list[str] = ["# Populate these secrets before deploying."]
-    for secret in secrets:
-        lines.append(f"# Source: node {secret.source_node}, field {secret.field}")
-        lines.append(f"{secret.env_var}=")
-    return "\n".join(lines) + "\n"
+    ).strip()
+    + "\n"
+)
 
 
-def _render_cli_module(package_name: str) -> str:
-    return (
-        textwrap.dedent(
-            f'''
+_CLI_MODULE_TEMPLATE = (
+    textwrap.dedent(
+        '''
         """Command line helpers for the {package_name} package."""
 
         from typing import Any
@@ -382,15 +408,18 @@ def _render_cli_module(package_name: str) -> str:
             response = main()
             print(response)
         '''
-        ).strip()
-        + "\n"
-    )
+    ).strip()
+    + "\n"
+)
 
 
-def _render_smoke_test(package_name: str, ir: IntermediateRepresentation) -> str:
-    content = (
-        textwrap.dedent(
-            """
+def _render_cli_module(package_name: str) -> str:
+    return _CLI_MODULE_TEMPLATE.format(package_name=package_name)
+
+
+_SMOKE_TEST_TEMPLATE = (
+    textwrap.dedent(
+        """
         from {pkg}.chains.main_chain import build_chain, run_chain
 
 
@@ -404,35 +433,30 @@ def _render_smoke_test(package_name: str, ir: IntermediateRepresentation) -> str
             result = run_chain("hello")
             assert result["message"] == "hello"
         """
-        )
-        .strip()
-        .format(pkg=package_name, first_node=ir.nodes[0].node_id if ir.nodes else "")
-    )
-    return content + "\n"
+    ).strip()
+    + "\n"
+)
 
 
-def _render_unit_test_config(package_name: str, secrets: tuple[DetectedSecret, ...]) -> str:
-    fields_assertion = "\n    ".join(
-        f"assert hasattr(settings, '{secret.attribute}')" for secret in secrets
-    )
-    body = textwrap.dedent(
-        f"""
-        from {package_name}.config import settings
+def _render_smoke_test(package_name: str, ir: IntermediateRepresentation) -> str:
+    first_node = ir.nodes[0].node_id if ir.nodes else ""
+    return _SMOKE_TEST_TEMPLATE.format(pkg=package_name, first_node=first_node)
 
 
-        def test_settings_exposes_expected_attributes() -> None:
-            assert settings is not None
-        """
-    ).strip()
-    if fields_assertion:
-        body += f"\n    {fields_assertion}"
-    return body + "\n"
+_UNIT_TEST_CONFIG_TEMPLATE = textwrap.dedent(
+    """
+    from {package_name}.config import settings
 
 
-def _render_unit_test_cli(package_name: str) -> str:
-    return (
-        textwrap.dedent(
-            f"""
+    def test_settings_exposes_expected_attributes() -> None:
+        assert settings is not None
+    """
+).strip()
+
+
+_UNIT_TEST_CLI_TEMPLATE = (
+    textwrap.dedent(
+        """
         from {package_name}.cli import main
 
 
@@ -440,15 +464,18 @@ def _render_unit_test_cli(package_name: str) -> str:
             result = main("ping")
             assert result["message"] == "ping"
         """
-        ).strip()
-        + "\n"
-    )
+    ).strip()
+    + "\n"
+)
 
 
-def _render_readme(ir: IntermediateRepresentation) -> str:
-    content = (
-        textwrap.dedent(
-            """
+def _render_unit_test_cli(package_name: str) -> str:
+    return _UNIT_TEST_CLI_TEMPLATE.format(package_name=package_name)
+
+
+_README_TEMPLATE = (
+    textwrap.dedent(
+        """
         # {name}
 
         Auto-generated LangChain project for flow `{flow_id}`.
@@ -462,11 +489,13 @@ def _render_readme(ir: IntermediateRepresentation) -> str:
         - `cli.py`: convenience entrypoint for local execution
         - `.env.example`: template for environment secrets
         """
-        )
-        .strip()
-        .format(name=ir.name or ir.flow_id, flow_id=ir.flow_id)
-    )
-    return content + "\n"
+    ).strip()
+    + "\n"
+)
+
+
+def _render_readme(ir: IntermediateRepresentation) -> str:
+    return _README_TEMPLATE.format(name=ir.name or ir.flow_id, flow_id=ir.flow_id)
 
 
 __all__ = ["LangChainProject", "generate_langchain_project"]
@@ -3,14 +3,23 @@
 from __future__ import annotations
 
 import textwrap
-from collections.abc import Iterable
 from dataclasses import dataclass
+from itertools import starmap
 from pathlib import Path
 
 from ..analyzer import FlowPattern, analyze_flow
 from ..extractors import DetectedSecret, detect_secrets
 from ..ir import IntermediateRepresentation
 from ..naming import slugify
+from ._common import (
+    FilesKey,
+    cached_files,
+    is_plain_literal,
+    render_config_init,
+    render_config_settings,
+    render_env_example,
+    render_unit_test_config,
+)
 from .project import GeneratedFile, ProjectScaffoldWriter, WriteResult
 
 SUPPORTED_PATTERNS = {FlowPattern.BRANCHING, FlowPattern.CYCLIC}
@@ -22,6 +31,7 @@ class LangGraphProject:
     package_name: str
     flow_id: str
     writes: tuple[WriteResult, ...]
+    files: tuple[GeneratedFile, ...]
 
 
 def generate_langgraph_project(
@@ -41,121 +51,133 @@ def generate_langgraph_project(
     package_name = slugify(ir.name or ir.flow_id, default="lf2x_graph")
     writer = ProjectScaffoldWriter(root, overwrite=overwrite)
     secrets = detect_secrets(ir)
-    writes = writer.write_files(_build_files(package_name, ir, secrets))
+    files = _build_files(package_name, ir, secrets)
+    writes = writer.write_files(files)
 
     return LangGraphProject(
         root=root,
         package_name=package_name,
         flow_id=ir.flow_id,
         writes=tuple(writes),
+        files=files,
     )
 
 
+_FILES_CACHE: dict[FilesKey, tuple[GeneratedFile, ...]] = {}
+
+
 def _build_files(
     package_name: str,
     ir: IntermediateRepresentation,
-    secrets: Iterable[DetectedSecret],
-) -> Iterable[GeneratedFile]:
-    detected = tuple(secrets)
-    yield GeneratedFile(Path("pyproject.toml"), _render_pyproject(package_name))
-    yield GeneratedFile(
-        Path("src") / package_name / "__init__.py",
-        "__all__ = ['build_graph', 'iter_edges']\n",
-    )
-    yield GeneratedFile(
-        Path("src") / package_name / "graphs" / "__init__.py",
-        "from .main_graph import build_graph, iter_edges\n",
-    )
-    yield GeneratedFile(
-        Path("src") / package_name / "graphs" / "main_graph.py",
-        _render_main_graph(ir),
-    )
-    yield GeneratedFile(
-        Path("src") / package_name / "nodes" / "__init__.py",
-        _render_nodes_init(),
-        todos=("Implement node-level handlers for LangGraph",),
-    )
-    yield GeneratedFile(
-        Path("src") / package_name / "state.py",
-        _render_state_module(),
-        todos=("Define structured state for graph execution",),
-    )
-    yield GeneratedFile(
-        Path("src") / package_name / "prompts" / "__init__.py",
-        _render_prompts_init(),
-        todos=("Customize prompt formatting for the generated flow",),
-    )
-    yield GeneratedFile(
-        Path("src") / package_name / "tools" / "__init__.py",
-        _render_tools_init(),
-        todos=("Hook external tools into the graph",),
-    )
-    yield GeneratedFile(
-        Path("src") / package_name / "tools" / "base_tool.py",
-        _render_tool_stub(),
-    )
-    yield GeneratedFile(
-        Path("src") / package_name / "config" / "__init__.py",
-        _render_config_init(),
-    )
-    yield GeneratedFile(
-        Path("src") / package_name / "config" / "settings.py",
-        _render_config_settings(detected),
-        todos=("Connect graph configuration to deployment runtime",),
-    )
-    yield GeneratedFile(
-        Path("src") / package_name / "cli.py",
-        _render_cli_module(package_name),
-        todos=("Expose graph operations via CLI",),
-    )
-    yield GeneratedFile(
-        Path("tests") / "smoke" / "test_flow.py",
-        _render_smoke_test(package_name),
-    )
-    yield GeneratedFile(
-        Path("tests") / "unit" / "test_config.py",
-        _render_unit_test_config(package_name, detected),
-    )
-    yield GeneratedFile(
-        Path("tests") / "unit" / "test_cli.py",
-        _render_unit_test_cli(package_name),
-    )
-    yield GeneratedFile(Path("README.md"), _render_readme(ir))
-    yield GeneratedFile(
-        Path(".env.example"),
-        _render_env_example(detected),
-        todos=("Set graph secrets before deployment",),
-    )
+    secrets: tuple[DetectedSecret, ...],
+) -> tuple[GeneratedFile, ...]:
+    return cached_files(_FILES_CACHE, _render_files, package_name, ir, secrets)
 
 
-def _render_pyproject(package_name: str) -> str:
+def _render_files(
+    package_name: str,
+    ir: IntermediateRepresentation,
+    secrets: tuple[DetectedSecret, ...],
+) -> tuple[GeneratedFile, ...]:
     return (
-        textwrap.dedent(
-            """
-            [build-system]
-            requires = ["setuptools>=68"]
-            build-backend = "setuptools.build_meta"
-
-            [project]
-            name = "{project_name}"
-            version = "0.0.0"
-            description = "Auto-generated LangGraph project"
-            requires-python = ">=3.11"
-            dependencies = ["langgraph>=0.0.30"]
-            """
-        )
-        .strip()
-        .format(project_name=package_name.replace("_", "-"))
-        + "\n"
+        GeneratedFile("pyproject.toml", _render_pyproject(package_name)),
+        GeneratedFile(
+            f"src/{package_name}/__init__.py",
+            "__all__ = ['build_graph', 'iter_edges']\n",
+        ),
+        GeneratedFile(
+            f"src/{package_name}/graphs/__init__.py",
+            "from .main_graph import build_graph, iter_edges\n",
+        ),
+        GeneratedFile(
+            f"src/{package_name}/graphs/main_graph.py",
+            _render_main_graph(ir),
+        ),
+        GeneratedFile(
+            f"src/{package_name}/nodes/__init__.py",
+            _render_nodes_init(),
+            todos=("Implement node-level handlers for LangGraph",),
+        ),
+        GeneratedFile(
+            f"src/{package_name}/state.py",
+            _render_state_module(),
+            todos=("Define structured state for graph execution",),
+        ),
+        GeneratedFile(
+            f"src/{package_name}/prompts/__init__.py",
+            _render_prompts_init(),
+            todos=("Customize prompt formatting for the generated flow",),
+        ),
+        GeneratedFile(
+            f"src/{package_name}/tools/__init__.py",
+            _render_tools_init(),
+            todos=("Hook external tools into the graph",),
+        ),
+        GeneratedFile(
+            f"src/{package_name}/tools/base_tool.py",
+            _render_tool_stub(),
+        ),
+        GeneratedFile(
+            f"src/{package_name}/config/__init__.py",
+            render_config_init(),
+        ),
+        GeneratedFile(
+            f"src/{package_name}/config/settings.py",
+            render_config_settings(_CONFIG_SETTINGS_TEMPLATE, _DEFAULT_CONFIG_SETTINGS, secrets),
+            todos=("Connect graph configuration to deployment runtime",),
+        ),
+        GeneratedFile(
+            f"src/{package_name}/cli.py",
+            _render_cli_module(package_name),
+            todos=("Expose graph operations via CLI",),
+        ),
+        GeneratedFile(
+            "tests/smoke/test_flow.py",
+            _render_smoke_test(package_name),
+        ),
+        GeneratedFile(
+            "tests/unit/test_config.py",
+            render_unit_test_config(_UNIT_TEST_CONFIG_TEMPLATE, package_name, secrets),
+        ),
+        GeneratedFile(
+            "tests/unit/test_cli.py",
+            _render_unit_test_cli(package_name),
+        ),
+        GeneratedFile("README.md", _render_readme(ir)),
+        GeneratedFile(
+            ".env.example",
+            render_env_example(secrets),
+            todos=("Set graph secrets before deployment",),
+        ),
     )
 
 
-def _render_main_graph(ir: IntermediateRepresentation) -> str:
-    nodes_literal = ",\n    ".join(repr(node.node_id) for node in ir.nodes)
-    edges_literal = ",\n    ".join(f"({edge.source!r}, {edge.target!r})" for edge in ir.edges)
-    template = (
-        textwrap.dedent(
-            '''
+_PYPROJECT_TEMPLATE = (
+    textwrap.dedent(
+        """
+        [build-system]
+        requires = ["setuptools>=68"]
+        build-backend = "setuptools.build_meta"
+
+        [project]
+        name = "{project_name}"
+        version = "0.0.0"
+        description = "Auto-generated LangGraph project"
+        requires-python = ">=3.11"
+        dependencies = ["langgraph>=0.0.30"]
+        """
+    ).strip()
+    + "\n"
+)
+
+
+def _render_pyproject(package_name: str) -> str:
+    return _PYPROJECT_TEMPLATE.format(project_name=package_name.replace("_", "-"))
+
+
+_MAIN_GRAPH_TEMPLATE = (
+    textwrap.dedent(
+        '''
         """LangGraph state graph stub generated from flow {flow_id}."""
 
         from collections.abc import Iterator
@@ -187,30 +209,51 @@ def _render_main_graph(ir: IntermediateRepresentation) -> str:
         def iter_edges() -> Iterator[tuple[str, str]]:
             yield from EDGE_IDS
         '''
-        )
-        .strip()
-        .format(flow_id=ir.flow_id, nodes=nodes_literal, edges=edges_literal)
-    )
-    return template + "\n"
+    ).strip()
+    + "\n"
+)
 
 
-def _render_nodes_init() -> str:
-    return (
-        textwrap.dedent(
-            '''
+# Bound str.format methods let starmap render each edge pair without a Python frame.
+_PLAIN_EDGE_FORMAT = "('{}', '{}')".format
+_REPR_EDGE_FORMAT = "({!r}, {!r})".format
+
+
+def _render_main_graph(ir: IntermediateRepresentation) -> str:
+    node_ids = ir.ordered_node_ids()
+    edge_pairs = ir.edge_pairs()
+    separator = ",\n    "
+    # One plainness check covers both literals, so the common case never calls repr.
+    if is_plain_literal(
+        "".join(node_ids) + "".join([source + target for source, target in edge_pairs])
+    ):
+        nodes_literal = "'" + f"'{separator}'".join(node_ids) + "'" if node_ids else ""
+        edges_literal = separator.join(starmap(_PLAIN_EDGE_FORMAT, edge_pairs))
+    else:
+        nodes_literal = separator.join(map(repr, node_ids))
+        edges_literal = separator.join(starmap(_REPR_EDGE_FORMAT, edge_pairs))
+    return _MAIN_GRAPH_TEMPLATE.format(flow_id=ir.flow_id, nodes=nodes_literal, edges=edges_literal)
+
+
+_NODES_INIT = (
+    textwrap.dedent(
+        '''
         """Hook points for LangGraph node behaviours."""
 
         __all__: list[str] = []
         '''
-        ).strip()
-        + "\n"
-    )
+    ).strip()
+    + "\n"
+).encode("utf-8")
 
 
-def _render_state_module() -> str:
-    return (
-        textwrap.dedent(
-            '''
+def _render_nodes_init() -> bytes:
+    return _NODES_INIT
+
+
+_STATE_MODULE = (
+    textwrap.dedent(
+        '''
         """State definition for the generated LangGraph project."""
 
         from __future__ import annotations
@@ -231,15 +274,18 @@ def _render_state_module() -> str:
 
             return GraphState()
         '''
-        ).strip()
-        + "\n"
-    )
+    ).strip()
+    + "\n"
+).encode("utf-8")
 
 
-def _render_prompts_init() -> str:
-    return (
-        textwrap.dedent(
-            '''
+def _render_state_module() -> bytes:
+    return _STATE_MODULE
+
+
+_PROMPTS_INIT = (
+    textwrap.dedent(
+        '''
         """Prompt utilities for the generated LangGraph."""
 
         def format_system_prompt(flow_name: str) -> str:
@@ -247,15 +293,18 @@ def _render_prompts_init() -> str:
 
             return f"System prompt for {flow_name}. Replace with flow-specific instructions."
         '''
-        ).strip()
-        + "\n"
-    )
+    ).strip()
+    + "\n"
+).encode("utf-8")
 
 
-def _render_tools_init() -> str:
-    return (
-        textwrap.dedent(
-            '''
+def _render_prompts_init() -> bytes:
+    return _PROMPTS_INIT
+
+
+_TOOLS_INIT = (
+    textwrap.dedent(
+        '''
         """Tool registry for graph execution."""
 
         from typing import Any
@@ -272,15 +321,18 @@ def _render_tools_init() -> str:
 
             raise KeyError(name)
         '''
-        ).strip()
-        + "\n"
-    )
+    ).strip()
+    + "\n"
+).encode("utf-8")
 
 
-def _render_tool_stub() -> str:
-    return (
-        textwrap.dedent(
-            '''
+def _render_tools_init() -> bytes:
+    return _TOOLS_INIT
+
+
+_TOOL_STUB = (
+    textwrap.dedent(
+        '''
         """Base class for LangGraph tool integrations."""
 
         from __future__ import annotations
@@ -300,23 +352,18 @@ def _render_tool_stub() -> str:
 
                 raise NotImplementedError
         '''
-        ).strip()
-        + "\n"
-    )
+    ).strip()
+    + "\n"
+).encode("utf-8")
 
 
-def _render_config_init() -> str:
-    return "from .settings import settings\n"
+def _render_tool_stub() -> bytes:
+    return _TOOL_STUB
 
 
-def _render_config_settings(secrets: tuple[DetectedSecret, ...]) -> str:
-    if secrets:
-        field_lines = "\n".join(f"            {secret.attribute}: str | None" for secret in secrets)
-        assignment_lines = "\n".join(
-            f"                {secret.attribute}=os.getenv('{secret.env_var}'),"
-            for secret in secrets
-        )
-        template = f'''
+_CONFIG_SETTINGS_TEMPLATE = (
+    textwrap.dedent(
+        '''
         """Configuration helpers for the generated LangGraph project."""
 
         from __future__ import annotations
@@ -329,24 +376,26 @@ def _render_config_settings(secrets: tuple[DetectedSecret, ...]) -> str:
         class Settings:
             """Define environment-derived configuration knobs."""
 
-{field_lines}
+        {field_lines}
 
 
         def load_settings() -> Settings:
             """Load settings from the environment."""
 
             return Settings(
-{assignment_lines}
+        {assignment_lines}
             )
 
 
         settings = load_settings()
         '''
-        return textwrap.dedent(template).strip() + "\n"
+    ).strip()
+    + "\n"
+)
 
-    return (
-        textwrap.dedent(
-            '''
+_DEFAULT_CONFIG_SETTINGS = (
+    textwrap.dedent(
+        '''
         """Configuration helpers for the generated LangGraph project."""
 
         from __future__ import annotations
@@ -371,26 +420,14 @@ def _render_config_settings(secrets: tuple[DetectedSecret, ...]) -> str:
 
         settings = load_settings()
         '''
-        ).strip()
-        + "\n"
-    )
-
-
-def _render_env_example(secrets: tuple[DetectedSecret, ...]) -> str:
-    if not secrets:
-        return "# No secrets detected in the flow. Add environment variables as needed.\n"
-
-    lines: list[str] = ["# Populate these secrets before deploying."]
-    for secret in secrets:
-        lines.append(f"# Source: node {secret.source_node}, field {secret.field}")
-        lines.append(f"{secret.env_var}=")
-    return "\n".join(lines) + "\n"
+    ).strip()
+    + "\n"
+)
 
 
-def _render_cli_module(package_name: str) -> str:
-    return (
-        textwrap.dedent(
-            f'''
+_CLI_MODULE_TEMPLATE = (
+    textwrap.dedent(
+        '''
         """Command line helpers for the {package_name} LangGraph project."""
 
         from typing import Any
@@ -410,14 +447,18 @@ def _render_cli_module(package_name: str) -> str:
             result = main()
             print(result)
         '''
-        ).strip()
-        + "\n"
-    )
+    ).strip()
+    + "\n"
+)
 
 
-def _render_smoke_test(package_name: str) -> str:
-    content = textwrap.dedent(
-        f"""
+def _render_cli_module(package_name: str) -> str:
+    return _CLI_MODULE_TEMPLATE.format(package_name=package_name)
+
+
+_SMOKE_TEST_TEMPLATE = (
+    textwrap.dedent(
+        """
         from {package_name}.graphs.main_graph import build_graph, iter_edges
 
 
@@ -431,31 +472,28 @@ def _render_smoke_test(package_name: str) -> str:
             assert edges
         """
     ).strip()
-    return content + "\n"
+    + "\n"
+)
 
 
-def _render_unit_test_config(package_name: str, secrets: tuple[DetectedSecret, ...]) -> str:
-    fields_assertion = "\n    ".join(
-        f"assert hasattr(settings, '{secret.attribute}')" for secret in secrets
-    )
-    body = textwrap.dedent(
-        f"""
-        from {package_name}.config import settings
+def _render_smoke_test(package_name: str) -> str:
+    return _SMOKE_TEST_TEMPLATE.format(package_name=package_name)
 
 
-        def test_settings_flags_are_accessible() -> None:
-            assert settings is not None
-        """
-    ).strip()
-    if fields_assertion:
-        body += f"\n    {fields_assertion}"
-    return body + "\n"
+_UNIT_TEST_CONFIG_TEMPLATE = textwrap.dedent(
+    """
+    from {package_name}.config import settings
 
 
-def _render_unit_test_cli(package_name: str) -> str:
-    return (
-        textwrap.dedent(
-            f"""
+    def test_settings_flags_are_accessible() -> None:
+        assert settings is not None
+    """
+).strip()
+
+
+_UNIT_TEST_CLI_TEMPLATE = (
+    textwrap.dedent(
+        """
         from {package_name}.cli import main
 
 
@@ -463,17 +501,21 @@ def _render_unit_test_cli(package_name: str) -> str:
             graph = main(debug=False)
             assert graph is not None
         """
-        ).strip()
-        + "\n"
-    )
+    ).strip()
+    + "\n"
+)
 
 
-def _render_readme(ir: IntermediateRepresentation) -> str:
-    content = textwrap.dedent(
-        f"""
-        # {ir.name or ir.flow_id}
+def _render_unit_test_cli(package_name: str) -> str:
+    return _UNIT_TEST_CLI_TEMPLATE.format(package_name=package_name)
 
-        Auto-generated LangGraph project for flow `{ir.flow_id}`.
+
+_README_TEMPLATE = (
+    textwrap.dedent(
+        """
+        # {name}
+
+        Auto-generated LangGraph project for flow `{flow_id}`.
 
         ## Structure
         - `graphs/`: state graph construction logic
@@ -486,7 +528,12 @@ def _render_readme(ir: IntermediateRepresentation) -> str:
         - `.env.example`: template for environment secrets
         """
     ).strip()
-    return content + "\n"
+    + "\n"
+)
+
+
+def _render_readme(ir: IntermediateRepresentation) -> str:
+    return _README_TEMPLATE.format(name=ir.name or ir.flow_id, flow_id=ir.flow_id)
 
 
 __all__ = ["LangGraphProject", "generate_langgraph_project"]
@@ -2,46 +2,39 @@
 
 from __future__ import annotations
 
+import os
 from collections.abc import Iterable
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Literal, cast
+from typing import Literal
+
+from .._io import write_bytes
 
 
 class OverwriteError(RuntimeError):
     """Raised when attempting to overwrite an existing file without permission."""
 
 
-_COMMENT_PREFIXES: dict[str, str] = {
-    ".py": "#",
-    ".toml": "#",
-    ".md": ">",
-    ".txt": "#",
-    ".yaml": "#",
-    ".yml": "#",
-    ".ini": "#",
-    ".cfg": "#",
-    ".env": "#",
-    ".example": "#",
-}
+def _comment_prefix(suffix: str) -> str | None:
+    match suffix:
+        case ".py" | ".toml" | ".txt" | ".yaml" | ".yml" | ".ini" | ".cfg" | ".env" | ".example":
+            return "#"
+        case ".md":
+            return ">"
+        case _:
+            return None
 
 
-@dataclass(slots=True)
+@dataclass(frozen=True, slots=True)
 class GeneratedFile:
     """Descriptor for a file the generators should materialize."""
 
-    relative_path: Path
-    content: str
+    # Frozen so rendered files can be cached and shared between generations.
+    # POSIX-style strings are joined onto the writer root as-is; ``Path`` also works.
+    relative_path: str | Path
+    content: str | bytes
     todos: tuple[str, ...] = field(default_factory=tuple)
 
-    def __post_init__(self) -> None:  # pragma: no cover - trivial normalization
-        if not isinstance(self.relative_path, Path):
-            self.relative_path = Path(self.relative_path)
-        if self.relative_path.is_absolute():
-            raise ValueError("Generated files must use relative paths")
-        if not isinstance(self.todos, tuple):
-            self.todos = tuple(self.todos)
-
 
 WriteStatus = Literal["created", "updated", "unchanged", "would-create", "would-update"]
 
@@ -75,45 +68,70 @@ class ProjectScaffoldWriter:
         """Write the provided files to disk and return the touched paths."""
 
         written: list[WriteResult] = []
+        # One scandir per directory answers "does it exist" for every sibling file.
+        listings: dict[Path, dict[str, os.DirEntry[str]]] = {}
+        dry_run = self.dry_run
+        # Status values are picked once; every result then shares the same string objects.
+        create_status: WriteStatus = "would-create" if dry_run else "created"
+        update_status: WriteStatus = "would-update" if dry_run else "updated"
         for file in files:
+            if os.path.isabs(file.relative_path):
+                raise ValueError("Generated files must use relative paths")
             target = self.root / file.relative_path
-            if not self.dry_run:
-                target.parent.mkdir(parents=True, exist_ok=True)
+            parent = target.parent
+            listing = listings.get(parent)
+            if listing is None:
+                listing = listings[parent] = self._list_directory(parent)
             content = self._render_content(target, file)
-            if target.exists():
-                existing = target.read_text(encoding=self.encoding)
-                if existing == content:
-                    written.append(
-                        WriteResult(path=target, status="unchanged", todos=tuple(file.todos))
-                    )
-                    continue
-                if not self.overwrite:
-                    raise OverwriteError(
-                        f"Refusing to overwrite existing file without --overwrite: {target}"
-                    )
-                status = cast(WriteStatus, "would-update" if self.dry_run else "updated")
-                if not self.dry_run:
-                    target.write_text(content, encoding=self.encoding)
-                written.append(WriteResult(path=target, status=status, todos=tuple(file.todos)))
+            entry = listing.get(target.name)
+            if entry is None:
+                if not dry_run:
+                    write_bytes(target, content)
+                written.append(WriteResult(path=target, status=create_status, todos=file.todos))
                 continue
 
-            status = cast(WriteStatus, "would-create" if self.dry_run else "created")
-            if not self.dry_run:
-                target.write_text(content, encoding=self.encoding)
-            written.append(WriteResult(path=target, status=status, todos=tuple(file.todos)))
+            # A size mismatch proves the file changed without reading it back.
+            if entry.stat().st_size == len(content) and target.read_bytes() == content:
+                written.append(WriteResult(path=target, status="unchanged", todos=file.todos))
+                continue
+            if not self.overwrite:
+                raise OverwriteError(
+                    f"Refusing to overwrite existing file without --overwrite: {target}"
+                )
+            if not dry_run:
+                write_bytes(target, content)
+            written.append(WriteResult(path=target, status=update_status, todos=file.todos))
         return written
 
-    def _render_content(self, target: Path, file: GeneratedFile) -> str:
-        body = file.content if file.content.endswith("\n") else f"{file.content}\n"
+    def _list_directory(self, directory: Path) -> dict[str, os.DirEntry[str]]:
+        try:
+            with os.scandir(directory) as entries:
+                return {entry.name: entry for entry in entries}
+        except FileNotFoundError:
+            if not self.dry_run:
+                directory.mkdir(parents=True, exist_ok=True)
+            return {}
+
+    def _render_content(self, target: Path, file: GeneratedFile) -> bytes:
+        content = file.content
+        if isinstance(content, str):
+            text = content if content.endswith("\n") else f"{content}\n"
+            body = text.encode(self.encoding)
+        else:
+            # Pre-encoded static scaffolds are written as-is, skipping re-encoding.
+            body = content if content.endswith(b"\n") else content + b"\n"
         if not file.todos:
             return body
-        prefix = _COMMENT_PREFIXES.get(target.suffix)
+        return self._todo_block(target, file).encode(self.encoding) + body
+
+    def _todo_block(self, target: Path, file: GeneratedFile) -> str:
+        prefix = _comment_prefix(target.suffix)
         if prefix is None:
             raise ValueError(
                 f"Cannot inject TODO markers for unsupported file type: {target.suffix or '<none>'}"
             )
-        todo_block = "\n".join(f"{prefix} TODO(lf2x): {item}" for item in file.todos)
-        return f"{todo_block}\n\n{body}"
+        todo_block = "\n".join([f"{prefix} TODO(lf2x): {item}" for item in file.todos])
+        return f"{todo_block}\n\n"
 
 
 __all__ = [
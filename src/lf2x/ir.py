@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from collections.abc import Mapping
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
-    from .parser import LangFlowDocument
+    from .parser import FlowEdge, FlowNode, LangFlowDocument
 
 
 @dataclass(frozen=True, slots=True)
@@ -16,7 +17,7 @@ class IRNode:
 
     node_id: str
     type: str
-    data: dict[str, Any]
+    data: Mapping[str, Any]
 
 
 @dataclass(frozen=True, slots=True)
@@ -26,7 +27,7 @@ class IREdge:
     edge_id: str
     source: str
     target: str
-    data: dict[str, Any]
+    data: Mapping[str, Any]
 
 
 @dataclass(frozen=True, slots=True)
@@ -47,16 +48,49 @@ class IntermediateRepresentation:
     nodes: tuple[IRNode, ...]
     edges: tuple[IREdge, ...]
     metadata: IRMetadata
+    # Lazily filled identifier views; the IR is frozen, so they never go stale.
+    _node_ids: frozenset[str] | None = field(default=None, init=False, repr=False, compare=False)
+    _edge_ids: frozenset[str] | None = field(default=None, init=False, repr=False, compare=False)
+    _node_order: tuple[str, ...] | None = field(default=None, init=False, repr=False, compare=False)
+    _edge_pairs: tuple[tuple[str, str], ...] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def node_ids(self) -> frozenset[str]:
+        """Return the set of node identifiers."""
+
+        node_ids = self._node_ids
+        if node_ids is None:
+            node_ids = frozenset(self.ordered_node_ids())
+            object.__setattr__(self, "_node_ids", node_ids)
+        return node_ids
+
+    def ordered_node_ids(self) -> tuple[str, ...]:
+        """Return node identifiers in declaration order."""
+
+        node_order = self._node_order
+        if node_order is None:
+            node_order = tuple([node.node_id for node in self.nodes])
+            object.__setattr__(self, "_node_order", node_order)
+        return node_order
 
-    def node_ids(self) -> set[str]:
-        """Return a set of node identifiers."""
+    def edge_pairs(self) -> tuple[tuple[str, str], ...]:
+        """Return ``(source, target)`` pairs in declaration order."""
 
-        return {node.node_id for node in self.nodes}
+        edge_pairs = self._edge_pairs
+        if edge_pairs is None:
+            edge_pairs = tuple([(edge.source, edge.target) for edge in self.edges])
+            object.__setattr__(self, "_edge_pairs", edge_pairs)
+        return edge_pairs
 
-    def edge_ids(self) -> set[str]:
-        """Return a set of edge identifiers."""
+    def edge_ids(self) -> frozenset[str]:
+        """Return the set of edge identifiers."""
 
-        return {edge.edge_id for edge in self.edges}
+        edge_ids = self._edge_ids
+        if edge_ids is None:
+            edge_ids = frozenset([edge.edge_id for edge in self.edges])
+            object.__setattr__(self, "_edge_ids", edge_ids)
+        return edge_ids
 
 
 def build_intermediate_representation(
@@ -64,10 +98,8 @@ def build_intermediate_representation(
 ) -> IntermediateRepresentation:
     """Construct an IR from a parsed LangFlow document."""
 
-    nodes = tuple(IRNode(node.node_id, node.type, dict(node.data)) for node in document.nodes)
-    edges = tuple(
-        IREdge(edge.edge_id, edge.source, edge.target, dict(edge.data)) for edge in document.edges
-    )
+    nodes = tuple(map(_to_ir_node, document.nodes))
+    edges = tuple(map(_to_ir_edge, document.edges))
     metadata = IRMetadata(
         source_path=document.metadata.source_path,
         output_dir=document.metadata.output_dir,
@@ -82,6 +114,14 @@ def build_intermediate_representation(
     )
 
 
+def _to_ir_node(node: FlowNode) -> IRNode:
+    return IRNode(node.node_id, node.type, node.data)
+
+
+def _to_ir_edge(edge: FlowEdge) -> IREdge:
+    return IREdge(edge.edge_id, edge.source, edge.target, edge.data)
+
+
 __all__ = [
     "IRNode",
     "IREdge",
@@ -8,6 +8,7 @@ preserving the relevant field names.
 
 from __future__ import annotations
 
+import sys
 from collections.abc import Mapping, Sequence
 from dataclasses import dataclass
 from typing import Any
@@ -25,8 +26,8 @@ class LangFlowEdgePayload:
     @classmethod
     def from_mapping(cls, mapping: Mapping[str, Any]) -> LangFlowEdgePayload:
         edge_id = _stringify(_require(mapping, "id"))
-        source = _stringify(_require(mapping, "source"))
-        target = _stringify(_require(mapping, "target"))
+        source = _intern_str(_require(mapping, "source"))
+        target = _intern_str(_require(mapping, "target"))
 
         data = mapping.get("data", {}) or {}
         if not isinstance(data, Mapping):
@@ -54,7 +55,7 @@ class LangFlowNodePayload:
         if raw_type is None:
             raise ValueError("Node entries must include 'type'")
 
-        return cls(node_id=node_id, type=_stringify(raw_type), data=data)
+        return cls(node_id=node_id, type=_intern_str(raw_type), data=data)
 
 
 @dataclass(frozen=True)
@@ -92,7 +93,8 @@ class LangFlowExport:
         tags_raw = mapping.get("tags") or []
         if not isinstance(tags_raw, Sequence) or isinstance(tags_raw, str | bytes):
             raise ValueError("'tags' must be a sequence if provided")
-        tags = [_stringify(tag) for tag in tags_raw]
+        stringify = _stringify
+        tags = [stringify(tag) for tag in tags_raw]
 
         version = mapping.get("version") or mapping.get("last_tested_version")
         if version is None:
@@ -123,25 +125,17 @@ class LangFlowExport:
 
 def _coerce_nodes(raw: Any) -> Sequence[LangFlowNodePayload]:
     if isinstance(raw, Sequence) and not isinstance(raw, str | bytes):
-        result: list[LangFlowNodePayload] = []
-        for item in raw:
-            if isinstance(item, LangFlowNodePayload):
-                result.append(item)
-            else:
-                result.append(LangFlowNodePayload.from_mapping(item))
-        return result
+        payload_type = LangFlowNodePayload
+        from_mapping = payload_type.from_mapping
+        return [item if isinstance(item, payload_type) else from_mapping(item) for item in raw]
     raise ValueError("'nodes' must be a list")
 
 
 def _coerce_edges(raw: Any) -> Sequence[LangFlowEdgePayload]:
     if isinstance(raw, Sequence) and not isinstance(raw, str | bytes):
-        result: list[LangFlowEdgePayload] = []
-        for item in raw:
-            if isinstance(item, LangFlowEdgePayload):
-                result.append(item)
-            else:
-                result.append(LangFlowEdgePayload.from_mapping(item))
-        return result
+        payload_type = LangFlowEdgePayload
+        from_mapping = payload_type.from_mapping
+        return [item if isinstance(item, payload_type) else from_mapping(item) for item in raw]
     raise ValueError("'edges' must be a list")
 
 
@@ -151,8 +145,14 @@ def _require(mapping: Mapping[str, Any], key: str) -> Any:
     return mapping[key]
 
 
+# JSON values are almost always ``str`` already; skip the str() call for them.
 def _stringify(value: Any) -> str:
-    return str(value)
+    return value if isinstance(value, str) else str(value)
+
+
+# Node types and edge endpoints repeat across a flow; interning lets them share one object.
+def _intern_str(value: Any) -> str:
+    return sys.intern(value if isinstance(value, str) else str(value))
 
 
 __all__ = [
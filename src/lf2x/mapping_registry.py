@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
 from typing import Literal
 
-import yaml
+from ._yaml import safe_load
 
 REGISTRY_PATH = Path(__file__).resolve().parent.parent.parent / "mappings" / "components.yaml"
 TargetType = Literal["langchain", "langgraph"]
@@ -43,25 +46,34 @@ class ComponentRegistry:
         entry = self.get(component_type)
         return entry.target if entry else None
 
-    def _load(self) -> dict[str, ComponentMapping]:
-        raw = yaml.safe_load(self._path.read_text())
-        if not isinstance(raw, list):
-            raise ValueError(f"Invalid component registry format in {self._path}")
-        entries: dict[str, ComponentMapping] = {}
-        for item in raw:
-            if not isinstance(item, dict):
-                continue
-            component_type = str(item.get("type"))
-            supported = bool(item.get("supported", False))
-            target = str(item.get("target"))
-            notes = item.get("notes")
-            entries[component_type] = ComponentMapping(
-                type=component_type,
-                supported=supported,
-                target=target,  # type: ignore[arg-type]
-                notes=str(notes) if notes is not None else None,
-            )
-        return entries
+    def _load(self) -> Mapping[str, ComponentMapping]:
+        stat = self._path.stat()
+        return _load_entries(str(self._path), stat.st_mtime_ns, stat.st_size)
+
+
+# The registry file is static between edits, so parsed entries are shared across
+# instances; the stat fields in the key invalidate the entry when the file changes.
+@lru_cache(maxsize=8)
+def _load_entries(path: str, mtime_ns: int, size: int) -> Mapping[str, ComponentMapping]:
+    del mtime_ns, size  # only part of the cache key
+    raw = safe_load(Path(path).read_text())
+    if not isinstance(raw, list):
+        raise ValueError(f"Invalid component registry format in {path}")
+    entries: dict[str, ComponentMapping] = {}
+    for item in raw:
+        if not isinstance(item, dict):
+            continue
+        component_type = str(item.get("type"))
+        supported = bool(item.get("supported", False))
+        target = str(item.get("target"))
+        notes = item.get("notes")
+        entries[component_type] = ComponentMapping(
+            type=component_type,
+            supported=supported,
+            target=target,  # type: ignore[arg-type]
+            notes=str(notes) if notes is not None else None,
+        )
+    return MappingProxyType(entries)
 
 
 def load_registry(path: Path | None = None) -> ComponentRegistry:
@@ -3,17 +3,31 @@
 from __future__ import annotations
 
 import re
+import string
+from functools import lru_cache
 
 _SLUG_PATTERN = re.compile(r"[^a-z0-9_]")
-_UNDERSCORE_RUN = re.compile(r"_+")
+# Maps every ASCII character outside ``[a-z0-9_]`` to an underscore in one C-level pass.
+_ASCII_SLUG_TABLE = str.maketrans(
+    {
+        chr(code): "_"
+        for code in range(128)
+        if chr(code) not in string.ascii_lowercase + string.digits + "_"
+    }
+)
 
 
+@lru_cache(maxsize=1024)
 def slugify(value: str, *, default: str) -> str:
     """Normalize a string for use in package names and directories."""
 
-    cleaned = value.strip().lower().replace(" ", "_").replace("/", "_")
-    cleaned = _SLUG_PATTERN.sub("_", cleaned)
-    cleaned = _UNDERSCORE_RUN.sub("_", cleaned).strip("_")
+    lowered = value.lower()
+    if lowered.isascii():
+        cleaned = lowered.translate(_ASCII_SLUG_TABLE)
+    else:
+        cleaned = _SLUG_PATTERN.sub("_", lowered)
+    # Splitting on "_" both collapses underscore runs and trims the ends.
+    cleaned = "_".join(part for part in cleaned.split("_") if part)
     return cleaned or default
 
 
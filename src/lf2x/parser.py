@@ -3,15 +3,24 @@
 from __future__ import annotations
 
 import json
+import mmap
+import os
 from collections.abc import Mapping, Sequence
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised when the speedups extra is absent
+    orjson = None  # type: ignore[assignment]
+
 from .config import LF2XSettings
 from .langflow_schema import LangFlowEdgePayload, LangFlowExport, LangFlowNodePayload
 
 SUPPORTED_VERSIONS: Sequence[str] = ("1.0.0", "1.5.1")
+_SUPPORTED_VERSION_SET = frozenset(SUPPORTED_VERSIONS)
+_MMAP_THRESHOLD = 1 << 20
 
 
 class UnsupportedFlowVersionError(ValueError):
@@ -32,7 +41,7 @@ class FlowNode:
 
     node_id: str
     type: str
-    data: dict[str, Any]
+    data: Mapping[str, Any]
 
 
 @dataclass(frozen=True, slots=True)
@@ -42,7 +51,7 @@ class FlowEdge:
     edge_id: str
     source: str
     target: str
-    data: dict[str, Any]
+    data: Mapping[str, Any]
 
 
 @dataclass(frozen=True, slots=True)
@@ -67,7 +76,10 @@ def parse_langflow_json(
     """Parse a LangFlow JSON export file from disk."""
 
     path = Path(source)
-    payload = json.loads(path.read_text(encoding=encoding))
+    if orjson is not None and encoding.lower().replace("-", "") == "utf8":
+        payload = _load_with_orjson(path)
+    else:
+        payload = json.loads(path.read_text(encoding=encoding))
     return parse_langflow_dict(
         payload,
         settings=settings,
@@ -76,6 +88,27 @@ def parse_langflow_json(
     )
 
 
+def _load_with_orjson(path: Path) -> Any:
+    with path.open("rb") as handle:
+        if os.fstat(handle.fileno()).st_size < _MMAP_THRESHOLD:
+            return _loads(handle.read())
+        # Large exports are parsed straight from the page cache without a read copy.
+        with (
+            mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped,
+            memoryview(mapped) as view,
+        ):
+            return _loads(view)
+
+
+def _loads(data: bytes | memoryview) -> Any:
+    try:
+        return orjson.loads(data)
+    except orjson.JSONDecodeError:
+        # NaN, Infinity and integers wider than 64 bits are valid for the stdlib parser,
+        # which needs a bytes copy of a memory-mapped view.
+        return json.loads(data if isinstance(data, bytes) else bytes(data))
+
+
 def parse_langflow_dict(
     payload: Mapping[str, Any],
     *,
@@ -101,7 +134,14 @@ def _document_from_export(
     supported_versions: Sequence[str],
     source_path: Path | None,
 ) -> LangFlowDocument:
-    if supported_versions and export.version not in supported_versions:
+    # The default tuple is checked through a prebuilt frozenset; the ordered
+    # sequence is kept for the error message.
+    allowed = (
+        _SUPPORTED_VERSION_SET
+        if supported_versions is SUPPORTED_VERSIONS
+        else frozenset(supported_versions)
+    )
+    if allowed and export.version not in allowed:
         message = (
             "Unsupported LangFlow version '"
             f"{export.version}'. Supported: {', '.join(supported_versions)}"
@@ -128,8 +168,14 @@ def _document_from_export(
     )
 
 
+# Node and edge data is copied once here into plain dicts, which keeps documents picklable
+# and JSON-serialisable; the IR shares them as-is and both expose them as read-only Mappings.
 def _convert_node(payload: LangFlowNodePayload) -> FlowNode:
-    return FlowNode(node_id=payload.node_id, type=payload.type, data=dict(payload.data))
+    return FlowNode(
+        node_id=payload.node_id,
+        type=payload.type,
+        data=dict(payload.data),
+    )
 
 
 def _convert_edge(payload: LangFlowEdgePayload) -> FlowEdge:
@@ -2,12 +2,21 @@
 
 from __future__ import annotations
 
+import io
 import json
+import os
 from collections import Counter
 from collections.abc import Iterable
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Any
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised when the speedups extra is absent
+    orjson = None  # type: ignore[assignment]
+
+from ._io import write_bytes
 from .analyzer import TargetRecommendation
 from .generators.project import WriteResult, WriteStatus
 
@@ -20,6 +29,11 @@ class ReportEntry:
     status: WriteStatus
     todos: tuple[str, ...]
 
+    def to_dict(self) -> dict[str, Any]:
+        """Return the JSON-serializable form of this entry."""
+
+        return {"path": str(self.path), "status": self.status, "todos": list(self.todos)}
+
 
 @dataclass(frozen=True, slots=True)
 class ConversionReport:
@@ -29,12 +43,26 @@ class ConversionReport:
     target: TargetRecommendation
     project_root: Path
     entries: tuple[ReportEntry, ...]
+    # Tallied once by build_report; reports built directly count their entries here.
+    counts: Counter[str] = field(default_factory=Counter)
+
+    def __post_init__(self) -> None:
+        if self.entries and not self.counts:
+            object.__setattr__(self, "counts", Counter(entry.status for entry in self.entries))
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the JSON-serializable form of this report."""
 
-    @property
-    def counts(self) -> Counter[str]:
-        """Return a counter of entry statuses."""
+        return self._payload([entry.to_dict() for entry in self.entries])
 
-        return Counter(entry.status for entry in self.entries)
+    def _payload(self, files: list[dict[str, Any]]) -> dict[str, Any]:
+        return {
+            "flow_id": self.flow_id,
+            "target": self.target.value,
+            "project_root": str(self.project_root),
+            "counts": dict(self.counts),
+            "files": files,
+        }
 
 
 @dataclass(frozen=True, slots=True)
@@ -55,22 +83,39 @@ def build_report(
     """Build a conversion report structure from generation metadata."""
 
     entries: list[ReportEntry] = []
+    tally: Counter[str] = Counter()
     root = project_root.resolve()
+    # Writer paths are joined onto the root as given, so a string prefix match usually
+    # yields the relative path without a realpath() call per file.
+    prefixes = dict.fromkeys((os.fspath(root) + os.sep, os.fspath(project_root) + os.sep))
     for write in writes:
+        status = write.status
+        tally[status] += 1
         path = write.path
-        try:
-            relative = path.resolve().relative_to(root)
-        except ValueError:
-            relative = path
-        entries.append(ReportEntry(path=relative, status=write.status, todos=write.todos))
+        text = os.fspath(path)
+        for prefix in prefixes:
+            if text.startswith(prefix) and ".." not in text:
+                relative = Path(text[len(prefix) :])
+                break
+        else:
+            relative = _relative_to_root(path, root)
+        entries.append(ReportEntry(path=relative, status=status, todos=write.todos))
     return ConversionReport(
         flow_id=flow_id,
         target=target,
         project_root=root,
         entries=tuple(entries),
+        counts=tally,
     )
 
 
+def _relative_to_root(path: Path, root: Path) -> Path:
+    try:
+        return path.resolve().relative_to(root)
+    except ValueError:
+        return path
+
+
 def write_conversion_report(
     *,
     flow_id: str,
@@ -87,54 +132,69 @@ def write_conversion_report(
         project_root=project_root,
         writes=writes,
     )
-    output_dir = (destination or project_root).resolve()
+    # Both artifacts are rendered before touching disk, so a failure never leaves half a report.
+    markdown_bytes, json_bytes = _render_artifacts(report)
+
+    # mkdir creates whatever is missing, so a lexical absolute path is enough here.
+    output_dir = Path(os.path.abspath(destination or project_root))
     output_dir.mkdir(parents=True, exist_ok=True)
 
     markdown_path = output_dir / "conversion_report.md"
     json_path = output_dir / "conversion_report.json"
 
-    markdown_path.write_text(_render_markdown(report), encoding="utf-8")
-    json_path.write_text(_render_json(report), encoding="utf-8")
+    write_bytes(markdown_path, markdown_bytes)
+    write_bytes(json_path, json_bytes)
     return ReportArtifacts(markdown=markdown_path, json=json_path)
 
 
-def _render_markdown(report: ConversionReport) -> str:
+_MARKDOWN_HEADER = (
+    "# Conversion Report for `{flow_id}`\n"
+    "\n"
+    "- Target: {target}\n"
+    "- Project root: `{project_root}`\n"
+    "- Files created: {created}\n"
+    "- Files updated: {updated}\n"
+    "- Files unchanged: {unchanged}\n"
+    "\n"
+    "## Files\n"
+    "| Path | Status | TODOs |\n"
+    "| --- | --- | --- |\n"
+)
+_MARKDOWN_ROW = "| {} | {} | {} |\n"
+
+
+def _render_artifacts(report: ConversionReport) -> tuple[bytes, bytes]:
+    # One walk over the entries feeds both the Markdown table and the JSON file list.
     counts = report.counts
-    lines: list[str] = [
-        f"# Conversion Report for `{report.flow_id}`",
-        "",
-        f"- Target: {report.target.value}",
-        f"- Project root: `{report.project_root}`",
-        f"- Files created: {counts.get('created', 0)}",
-        f"- Files updated: {counts.get('updated', 0)}",
-        f"- Files unchanged: {counts.get('unchanged', 0)}",
-        "",
-        "## Files",
-        "| Path | Status | TODOs |",
-        "| --- | --- | --- |",
-    ]
+    buffer = io.StringIO()
+    write = buffer.write
+    write(
+        _MARKDOWN_HEADER.format(
+            flow_id=report.flow_id,
+            target=report.target.value,
+            project_root=report.project_root,
+            created=counts["created"],
+            updated=counts["updated"],
+            unchanged=counts["unchanged"],
+        )
+    )
+    row = _MARKDOWN_ROW.format
+    join_todos = "<br />".join
+    files: list[dict[str, Any]] = []
+    append = files.append
     for entry in report.entries:
-        todos = "<br />".join(entry.todos) if entry.todos else ""
-        lines.append(f"| {entry.path} | {entry.status} | {todos} |")
-    return "\n".join(lines) + "\n"
-
-
-def _render_json(report: ConversionReport) -> str:
-    payload = {
-        "flow_id": report.flow_id,
-        "target": report.target.value,
-        "project_root": str(report.project_root),
-        "counts": dict(report.counts),
-        "files": [
-            {
-                "path": str(entry.path),
-                "status": entry.status,
-                "todos": list(entry.todos),
-            }
-            for entry in report.entries
-        ],
-    }
-    return json.dumps(payload, indent=2) + "\n"
+        data = entry.to_dict()
+        append(data)
+        write(row(data["path"], entry.status, join_todos(entry.todos)))
+    return buffer.getvalue().encode("utf-8"), _encode_json(report._payload(files))
+
+
+def _encode_json(payload: dict[str, Any]) -> bytes:
+    if orjson is not None:
+        # Written as-is: skips the decode/re-encode round trip through str.
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    # ensure_ascii=False matches orjson's raw UTF-8 output byte for byte.
+    return (json.dumps(payload, indent=2, ensure_ascii=False) + "\n").encode("utf-8")
 
 
 __all__ = [
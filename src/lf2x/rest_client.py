@@ -2,18 +2,32 @@
 
 from __future__ import annotations
 
-from collections.abc import Generator, Iterable, Mapping
-from dataclasses import dataclass
+import asyncio
+import hashlib
+import importlib.util
+from collections.abc import AsyncGenerator, Callable, Generator, Iterable, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, cast
 
 import httpx
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised when the speedups extra is absent
+    orjson = None  # type: ignore[assignment]
+
 from .config import LF2XSettings
 from .ir import IntermediateRepresentation, build_intermediate_representation
 from .parser import LangFlowDocument, parse_langflow_dict
 
 DEFAULT_TIMEOUT_SECONDS = 10.0
+DEFAULT_CONCURRENCY = 16
+# HTTP/2 multiplexes concurrent requests over one connection; it needs the optional h2 package.
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+_POOL_LIMITS = httpx.Limits(max_keepalive_connections=32, max_connections=64)
+_IR_CACHE_SIZE = 128
 API_PREFIX = "/api/v1/flows"
 
 
@@ -29,6 +43,43 @@ class LangFlowNotFoundError(LangFlowAPIError):
     """Raised when the requested flow does not exist (HTTP 404)."""
 
 
+def _decode_json(response: httpx.Response) -> Any:
+    # orjson parses the raw body bytes directly, skipping httpx's text decode.
+    if orjson is not None:
+        try:
+            return orjson.loads(response.content)
+        except orjson.JSONDecodeError:
+            # NaN, Infinity and integers wider than 64 bits only parse with the stdlib.
+            pass
+    return response.json()
+
+
+def _mapping_tags(value: Mapping[str, Any]) -> tuple[str, ...]:
+    return tuple(value.values())
+
+
+def _sequence_tags(value: Iterable[Any]) -> tuple[str, ...]:
+    return tuple(map(str, value))
+
+
+def _coerce_tags(value: Any) -> tuple[str, ...]:
+    # Fallback for subclasses and ABC-registered mappings missed by the exact-type table.
+    if isinstance(value, Mapping):
+        return _mapping_tags(value)
+    if isinstance(value, list | tuple | set):
+        return _sequence_tags(value)
+    return ()
+
+
+# Exact JSON container types dispatch with one dict lookup instead of ABC isinstance checks.
+_TAG_HANDLERS: dict[type, Callable[[Any], tuple[str, ...]]] = {
+    dict: _mapping_tags,
+    list: _sequence_tags,
+    tuple: _sequence_tags,
+    set: _sequence_tags,
+}
+
+
 @dataclass(frozen=True, slots=True)
 class FlowSummary:
     """Summary information about a LangFlow flow."""
@@ -45,13 +96,9 @@ class FlowSummary:
         flow_id = str(raw_id)
         name = str(payload.get("name") or flow_id)
         tags_value = payload.get("tags", [])
-        if isinstance(tags_value, Mapping):
-            tags_iter: Iterable[str] = tags_value.values()
-        elif isinstance(tags_value, list | tuple | set):
-            tags_iter = (str(tag) for tag in tags_value)
-        else:
-            tags_iter = ()
-        return cls(flow_id=flow_id, name=name, tags=tuple(tags_iter))
+        # Exact types hit the table; subclasses miss it and take the isinstance path.
+        handler = _TAG_HANDLERS.get(type(tags_value), _coerce_tags)
+        return cls(flow_id=flow_id, name=name, tags=handler(tags_value))
 
 
 @dataclass(frozen=True, slots=True)
@@ -70,13 +117,27 @@ class FlowPage:
 
 @dataclass(slots=True)
 class LangFlowClient:
-    """Minimal REST client for retrieving LangFlow flows."""
+    """Minimal REST client for retrieving LangFlow flows.
+
+    The first request opens a pooled connection that later requests reuse. Call
+    :meth:`close` or use the client as a context manager to release it; for a single
+    fetch, :meth:`one_shot_fetch` does both.
+    """
 
     base_url: str
     token: str | None = None
     timeout: float = DEFAULT_TIMEOUT_SECONDS
     verify: bool | str = True
     transport: httpx.BaseTransport | None = None
+    async_transport: httpx.AsyncBaseTransport | None = None
+    http2: bool = HTTP2_AVAILABLE
+    _client: httpx.Client | None = field(default=None, init=False, repr=False, compare=False)
+    _prefetch_pool: ThreadPoolExecutor | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _ir_cache: dict[tuple[str, Path, bytes], IntermediateRepresentation] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
 
     @classmethod
     def from_settings(
@@ -86,6 +147,7 @@ class LangFlowClient:
         timeout: float = DEFAULT_TIMEOUT_SECONDS,
         verify: bool | str = True,
         transport: httpx.BaseTransport | None = None,
+        async_transport: httpx.AsyncBaseTransport | None = None,
     ) -> LangFlowClient:
         """Build a client from LF2X settings."""
 
@@ -97,16 +159,31 @@ class LangFlowClient:
             timeout=timeout,
             verify=verify,
             transport=transport,
+            async_transport=async_transport,
         )
 
+    @classmethod
+    def one_shot_fetch(
+        cls,
+        base_url: str,
+        flow_id: str,
+        *,
+        token: str | None = None,
+        timeout: float = DEFAULT_TIMEOUT_SECONDS,
+        verify: bool | str = True,
+        transport: httpx.BaseTransport | None = None,
+    ) -> Mapping[str, Any]:
+        """Fetch one flow's JSON with a short-lived client that is closed afterwards."""
+
+        with cls(
+            base_url=base_url, token=token, timeout=timeout, verify=verify, transport=transport
+        ) as client:
+            return client.fetch_flow_json(flow_id)
+
     def fetch_flow_json(self, flow_id: str) -> Mapping[str, Any]:
         """Return the raw JSON payload for a LangFlow flow."""
 
-        response = self._request(flow_id)
-        payload = response.json()
-        if not isinstance(payload, Mapping):
-            raise LangFlowAPIError("Unexpected response payload from LangFlow API")
-        return cast(Mapping[str, Any], payload)
+        return self._flow_payload(self._request(flow_id))
 
     def fetch_flow_document(
         self,
@@ -131,8 +208,23 @@ class LangFlowClient:
     ) -> IntermediateRepresentation:
         """Return the Intermediate Representation for the given flow."""
 
-        document = self.fetch_flow_document(flow_id, settings=settings)
-        return build_intermediate_representation(document)
+        response = self._request(flow_id)
+        # Unchanged flow bodies reuse the IR built earlier in this client's lifetime.
+        output_dir = (settings or LF2XSettings()).resolve_output_dir()
+        # A digest stands in for the body so cached entries do not pin full responses.
+        key = (flow_id, output_dir, hashlib.blake2b(response.content).digest())
+        ir = self._ir_cache.get(key)
+        if ir is None:
+            document = parse_langflow_dict(
+                self._flow_payload(response),
+                settings=settings,
+                source_path=self._source_path(flow_id),
+            )
+            ir = build_intermediate_representation(document)
+            if len(self._ir_cache) >= _IR_CACHE_SIZE:
+                del self._ir_cache[next(iter(self._ir_cache))]
+            self._ir_cache[key] = ir
+        return ir
 
     def list_flows(
         self,
@@ -143,45 +235,41 @@ class LangFlowClient:
     ) -> FlowPage:
         """Return a page of flow summaries."""
 
-        params: dict[str, Any] = {"limit": limit, "offset": offset}
-        if tags:
-            params["tags"] = ",".join(tags)
-        response = self._request_collection(params)
-        data = response.json()
-        if not isinstance(data, Mapping):
-            raise LangFlowAPIError("Unexpected response payload for list_flows")
-        items = data.get("data")
-        if not isinstance(items, list):
-            raise LangFlowAPIError("LangFlow list response missing 'data' array")
-        summaries = tuple(FlowSummary.from_payload(item) for item in items)
-        pagination = data.get("pagination")
-        if isinstance(pagination, Mapping):
-            total = int(pagination.get("total", len(summaries)))
-            page_limit = int(pagination.get("limit", limit))
-            page_offset = int(pagination.get("offset", offset))
-        else:
-            total = len(summaries)
-            page_limit = limit
-            page_offset = offset
-        return FlowPage(flows=summaries, total=total, offset=page_offset, limit=page_limit)
+        response = self._request_collection(self._collection_params(limit, offset, tags))
+        return self._parse_page(response, limit, offset)
 
     def iter_flow_summaries(
         self,
         *,
         page_size: int = 50,
         tags: Iterable[str] | None = None,
+        prefetch: bool = True,
     ) -> Generator[FlowSummary, None, None]:
-        """Yield summaries for all flows, handling pagination."""
+        """Yield summaries for all flows, handling pagination.
 
-        offset = 0
-        while True:
-            page = self.list_flows(limit=page_size, offset=offset, tags=tags)
-            if not page.flows:
-                break
-            yield from page.flows
+        With ``prefetch`` the next page is requested in the background while the
+        current one is being consumed.
+        """
+
+        tag_list = self._normalize_tags(tags)
+        page = self.list_flows(limit=page_size, offset=0, tags=tag_list)
+        while page.flows:
             offset = page.offset + len(page.flows)
             if offset >= page.total:
+                yield from page.flows
                 break
+            pending = (
+                self._get_prefetch_pool().submit(
+                    self.list_flows, limit=page_size, offset=offset, tags=tag_list
+                )
+                if prefetch
+                else None
+            )
+            yield from page.flows
+            if pending is None:
+                page = self.list_flows(limit=page_size, offset=offset, tags=tag_list)
+            else:
+                page = pending.result()
 
     def iter_flow_documents(
         self,
@@ -207,42 +295,257 @@ class LangFlowClient:
         for document in self.iter_flow_documents(page_size=page_size, tags=tags, settings=settings):
             yield build_intermediate_representation(document)
 
+    async def afetch_flow_json(self, flow_id: str) -> Mapping[str, Any]:
+        """Asynchronously return the raw JSON payload for a LangFlow flow."""
+
+        async with self._open_async_client() as client:
+            return await self._afetch_flow_json(client, flow_id)
+
+    async def afetch_flow_document(
+        self,
+        flow_id: str,
+        *,
+        settings: LF2XSettings | None = None,
+    ) -> LangFlowDocument:
+        """Asynchronously return a parsed LangFlow document for the given flow."""
+
+        async with self._open_async_client() as client:
+            return await self._afetch_flow_document(client, flow_id, settings)
+
+    async def alist_flows(
+        self,
+        *,
+        limit: int = 50,
+        offset: int = 0,
+        tags: Iterable[str] | None = None,
+    ) -> FlowPage:
+        """Asynchronously return a page of flow summaries."""
+
+        async with self._open_async_client() as client:
+            return await self._alist_flows(client, limit, offset, tags)
+
+    async def aiter_flow_documents(
+        self,
+        *,
+        page_size: int = 50,
+        tags: Iterable[str] | None = None,
+        settings: LF2XSettings | None = None,
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> AsyncGenerator[LangFlowDocument, None]:
+        """Yield LangFlow documents for all flows, fetching each page concurrently."""
+
+        tag_list = self._normalize_tags(tags)
+        async with self._open_async_client() as client:
+            offset = 0
+            while True:
+                page = await self._alist_flows(client, page_size, offset, tag_list)
+                if not page.flows:
+                    break
+                flow_ids = [summary.flow_id for summary in page.flows]
+                for document in await self._agather_documents(
+                    client, flow_ids, settings, concurrency
+                ):
+                    yield document
+                offset = page.offset + len(page.flows)
+                if offset >= page.total:
+                    break
+
+    def fetch_many(
+        self,
+        flow_ids: Sequence[str],
+        *,
+        settings: LF2XSettings | None = None,
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> list[LangFlowDocument]:
+        """Fetch several flows concurrently, returning documents in ``flow_ids`` order.
+
+        This drives its own event loop, so it cannot be called while one is already
+        running (e.g. in Jupyter or an async app); await the ``a*`` methods there instead.
+        """
+
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            raise RuntimeError(
+                "fetch_many() cannot run inside an active event loop; "
+                "await afetch_flow_document() or aiter_flow_documents() instead"
+            )
+
+        async def run() -> list[LangFlowDocument]:
+            async with self._open_async_client() as client:
+                return await self._agather_documents(client, flow_ids, settings, concurrency)
+
+        return asyncio.run(run())
+
+    def close(self) -> None:
+        """Close the pooled HTTP connection and prefetch worker, if they were started."""
+
+        pool = self._prefetch_pool
+        if pool is not None:
+            self._prefetch_pool = None
+            pool.shutdown(wait=True)
+        client = self._client
+        if client is not None:
+            self._client = None
+            client.close()
+
+    def __enter__(self) -> LangFlowClient:
+        return self
+
+    def __exit__(self, *_exc_info: object) -> None:
+        self.close()
+
+    def __del__(self) -> None:
+        # Best effort for owners that never call close(); the attribute may be missing
+        # if __init__ failed.
+        pool = getattr(self, "_prefetch_pool", None)
+        if pool is not None:
+            pool.shutdown(wait=False)
+        client = getattr(self, "_client", None)
+        if client is not None:
+            client.close()
+
+    def _get_client(self) -> httpx.Client:
+        # Built once so every request shares one keep-alive connection pool.
+        client = self._client
+        if client is None:
+            client = httpx.Client(
+                base_url=self._base_url,
+                headers=self._headers(),
+                timeout=self.timeout,
+                verify=self.verify,
+                http2=self.http2,
+                limits=_POOL_LIMITS,
+                transport=self.transport,
+            )
+            self._client = client
+        return client
+
+    def _get_prefetch_pool(self) -> ThreadPoolExecutor:
+        # One worker per client keeps the next page request in flight without letting a
+        # slow server stall prefetching for other clients.
+        pool = self._prefetch_pool
+        if pool is None:
+            pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="lf2x-prefetch")
+            self._prefetch_pool = pool
+        return pool
+
     def _request(self, flow_id: str) -> httpx.Response:
-        url = f"{self._base_url}{API_PREFIX}/{flow_id}"
-        headers = {"Accept": "application/json"}
-        if self.token:
-            headers["Authorization"] = f"Bearer {self.token}"
+        response = self._get_client().get(f"{API_PREFIX}/{flow_id}")
+        if response.status_code == 404:
+            raise LangFlowNotFoundError(f"Flow '{flow_id}' was not found")
+        return self._check_response(response)
+
+    def _request_collection(self, params: Mapping[str, Any]) -> httpx.Response:
+        response = self._get_client().get(API_PREFIX, params=params)
+        return self._check_response(response)
+
+    @staticmethod
+    def _parse_page(response: httpx.Response, limit: int, offset: int) -> FlowPage:
+        data = _decode_json(response)
+        if not isinstance(data, Mapping):
+            raise LangFlowAPIError("Unexpected response payload for list_flows")
+        items = data.get("data")
+        if not isinstance(items, list):
+            raise LangFlowAPIError("LangFlow list response missing 'data' array")
+        summaries = tuple(FlowSummary.from_payload(item) for item in items)
+        pagination = data.get("pagination")
+        if isinstance(pagination, Mapping):
+            total = int(pagination.get("total", len(summaries)))
+            page_limit = int(pagination.get("limit", limit))
+            page_offset = int(pagination.get("offset", offset))
+        else:
+            total = len(summaries)
+            page_limit = limit
+            page_offset = offset
+        return FlowPage(flows=summaries, total=total, offset=page_offset, limit=page_limit)
+
+    @staticmethod
+    def _normalize_tags(tags: Iterable[str] | None) -> tuple[str, ...] | None:
+        # Materialized once so one-shot iterables survive every page request.
+        return (tuple(tags) or None) if tags is not None else None
 
-        with httpx.Client(
+    @staticmethod
+    def _collection_params(limit: int, offset: int, tags: Iterable[str] | None) -> dict[str, Any]:
+        params: dict[str, Any] = {"limit": limit, "offset": offset}
+        if tags:
+            params["tags"] = ",".join(tags)
+        return params
+
+    @staticmethod
+    def _flow_payload(response: httpx.Response) -> Mapping[str, Any]:
+        payload = _decode_json(response)
+        if not isinstance(payload, Mapping):
+            raise LangFlowAPIError("Unexpected response payload from LangFlow API")
+        return cast(Mapping[str, Any], payload)
+
+    def _open_async_client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            base_url=self._base_url,
+            headers=self._headers(),
             timeout=self.timeout,
             verify=self.verify,
-            transport=self.transport,
-        ) as client:
-            response = client.get(url, headers=headers)
+            http2=self.http2,
+            limits=_POOL_LIMITS,
+            transport=self.async_transport,
+        )
 
-        if response.status_code in {401, 403}:
-            raise LangFlowAuthError("Authentication failed for LangFlow API request")
+    async def _afetch_flow_json(self, client: httpx.AsyncClient, flow_id: str) -> Mapping[str, Any]:
+        response = await client.get(f"{API_PREFIX}/{flow_id}")
         if response.status_code == 404:
             raise LangFlowNotFoundError(f"Flow '{flow_id}' was not found")
-        if response.status_code >= 400:
-            raise LangFlowAPIError(
-                f"LangFlow API request failed with status {response.status_code}: {response.text}"
-            )
-        return response
+        return self._flow_payload(self._check_response(response))
 
-    def _request_collection(self, params: Mapping[str, Any]) -> httpx.Response:
-        url = f"{self._base_url}{API_PREFIX}"
+    async def _afetch_flow_document(
+        self,
+        client: httpx.AsyncClient,
+        flow_id: str,
+        settings: LF2XSettings | None,
+    ) -> LangFlowDocument:
+        payload = await self._afetch_flow_json(client, flow_id)
+        return parse_langflow_dict(
+            payload,
+            settings=settings,
+            source_path=self._source_path(flow_id),
+        )
+
+    async def _alist_flows(
+        self,
+        client: httpx.AsyncClient,
+        limit: int,
+        offset: int,
+        tags: Iterable[str] | None,
+    ) -> FlowPage:
+        params = self._collection_params(limit, offset, tags)
+        response = self._check_response(await client.get(API_PREFIX, params=params))
+        return self._parse_page(response, limit, offset)
+
+    async def _agather_documents(
+        self,
+        client: httpx.AsyncClient,
+        flow_ids: Sequence[str],
+        settings: LF2XSettings | None,
+        concurrency: int,
+    ) -> list[LangFlowDocument]:
+        # The semaphore caps in-flight requests; gather keeps results in input order.
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch(flow_id: str) -> LangFlowDocument:
+            async with semaphore:
+                return await self._afetch_flow_document(client, flow_id, settings)
+
+        return list(await asyncio.gather(*(fetch(flow_id) for flow_id in flow_ids)))
+
+    def _headers(self) -> dict[str, str]:
         headers = {"Accept": "application/json"}
         if self.token:
             headers["Authorization"] = f"Bearer {self.token}"
+        return headers
 
-        with httpx.Client(
-            timeout=self.timeout,
-            verify=self.verify,
-            transport=self.transport,
-        ) as client:
-            response = client.get(url, headers=headers, params=params)
-
+    @staticmethod
+    def _check_response(response: httpx.Response) -> httpx.Response:
         if response.status_code in {401, 403}:
             raise LangFlowAuthError("Authentication failed for LangFlow API request")
         if response.status_code >= 400:
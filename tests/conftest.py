@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import os
+import shutil
+import tempfile
+from collections.abc import Callable
+from functools import partial
+from pathlib import Path
+
+import pytest
+
+from lf2x.generators.langchain import LangChainProject
+from lf2x.generators.langgraph import LangGraphProject
+from lf2x.ir import IntermediateRepresentation, build_intermediate_representation
+from lf2x.parser import parse_langflow_json
+
+FIXTURE_DIR = Path(__file__).parent / "fixtures" / "flows"
+_RAM_TEMP_ROOT = "/dev/shm"
+_RAM_TEMP_MIN_FREE = 256 * 1024 * 1024
+
+
+def _ram_temp_available() -> bool:
+    try:
+        stats = os.statvfs(_RAM_TEMP_ROOT)
+    except (AttributeError, OSError):
+        return False
+    free = stats.f_bavail * stats.f_frsize
+    return free >= _RAM_TEMP_MIN_FREE and os.access(_RAM_TEMP_ROOT, os.W_OK)
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_configure(config: pytest.Config) -> None:
+    # Generator and writer tests are dominated by small-file I/O; root tmp_path on tmpfs
+    # when it has room and the caller has not chosen a --basetemp. Only pytest's temp
+    # directories move; the stdlib tempfile default used by the code under test does not.
+    if config.option.basetemp is None and _ram_temp_available():
+        basetemp = tempfile.mkdtemp(prefix="lf2x-pytest-", dir=_RAM_TEMP_ROOT)
+        config.option.basetemp = basetemp
+        config.add_cleanup(partial(shutil.rmtree, basetemp, ignore_errors=True))
+
+
+# Tests that only compare output paths, and never write to them, share one directory.
+@pytest.fixture(scope="session")
+def path_root(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    return tmp_path_factory.mktemp("paths")
+
+
+# IRs are immutable, so each fixture flow is parsed once and shared across tests.
+@pytest.fixture(scope="session")
+def simple_passthrough_ir() -> IntermediateRepresentation:
+    return build_intermediate_representation(
+        parse_langflow_json(FIXTURE_DIR / "simple_passthrough.json")
+    )
+
+
+@pytest.fixture(scope="session")
+def price_deal_finder_ir() -> IntermediateRepresentation:
+    return build_intermediate_representation(
+        parse_langflow_json(FIXTURE_DIR / "price_deal_finder.json")
+    )
+
+
+# Rendered content is kept on generated projects, so template checks need no disk reads.
+@pytest.fixture(scope="session")
+def generated_text() -> Callable[[LangChainProject | LangGraphProject, str], str]:
+    def _read(project: LangChainProject | LangGraphProject, relative_path: str) -> str:
+        target = Path(relative_path)
+        for file in project.files:
+            if Path(file.relative_path) == target:
+                content = file.content
+                return content.decode() if isinstance(content, bytes) else content
+        raise KeyError(relative_path)
+
+    return _read
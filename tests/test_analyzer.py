@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from pathlib import Path
 
-from lf2x.analyzer import FlowPattern, TargetRecommendation, analyze_flow
+from lf2x.analyzer import FlowPattern, TargetRecommendation, analyze_flow, recommend_target
 from lf2x.ir import (
     IntermediateRepresentation,
     IREdge,
@@ -15,13 +15,10 @@ from lf2x.parser import parse_langflow_json
 FIXTURE_DIR = Path(__file__).parent / "fixtures" / "flows"
 
 
-def _build_ir(fixture_name: str) -> IntermediateRepresentation:
-    document = parse_langflow_json(FIXTURE_DIR / fixture_name)
-    return build_intermediate_representation(document)
-
-
-def test_analyze_flow_linear_recommends_langchain() -> None:
-    ir = _build_ir("simple_passthrough.json")
+def test_analyze_flow_linear_recommends_langchain(
+    simple_passthrough_ir: IntermediateRepresentation,
+) -> None:
+    ir = simple_passthrough_ir
 
     analysis = analyze_flow(ir)
 
@@ -31,8 +28,10 @@ def test_analyze_flow_linear_recommends_langchain() -> None:
     assert analysis.has_branching is False
 
 
-def test_analyze_flow_branching_recommends_langgraph() -> None:
-    ir = _build_ir("price_deal_finder.json")
+def test_analyze_flow_branching_recommends_langgraph(
+    price_deal_finder_ir: IntermediateRepresentation,
+) -> None:
+    ir = price_deal_finder_ir
 
     analysis = analyze_flow(ir)
 
@@ -70,3 +69,75 @@ def test_analyze_flow_detects_cycles() -> None:
     assert analysis.pattern is FlowPattern.CYCLIC
     assert analysis.recommended_target is TargetRecommendation.LANGGRAPH
     assert analysis.has_cycles is True
+
+
+def test_analyze_flow_handles_deep_linear_chains() -> None:
+    depth = 5000
+    nodes = tuple(IRNode(f"n{index}", "Step", {}) for index in range(depth))
+    edges = tuple(
+        IREdge(f"e{index}", f"n{index}", f"n{index + 1}", {}) for index in range(depth - 1)
+    )
+    ir = IntermediateRepresentation(
+        flow_id="deep",
+        name="Deep",
+        version="1.0.0",
+        nodes=nodes,
+        edges=edges,
+        metadata=IRMetadata(source_path=Path("deep.json"), output_dir=Path("dist")),
+    )
+
+    analysis = analyze_flow(ir)
+
+    assert analysis.pattern is FlowPattern.LINEAR
+    assert analysis.has_cycles is False
+
+
+def test_analyze_flow_handles_wide_fan_out_with_repeated_edges() -> None:
+    width = 2000
+    nodes = (IRNode("hub", "Router", {}),) + tuple(
+        IRNode(f"leaf{index}", "Step", {}) for index in range(width)
+    )
+    edges = tuple(
+        IREdge(f"e{copy}-{index}", "hub", f"leaf{index}", {})
+        for copy in range(2)
+        for index in range(width)
+    )
+    ir = IntermediateRepresentation(
+        flow_id="wide",
+        name="Wide",
+        version="1.0.0",
+        nodes=nodes,
+        edges=edges,
+        metadata=IRMetadata(source_path=Path("wide.json"), output_dir=Path("dist")),
+    )
+
+    analysis = analyze_flow(ir)
+
+    assert analysis.pattern is FlowPattern.BRANCHING
+    assert analysis.has_cycles is False
+
+
+def test_analyze_flow_tolerates_edges_to_undeclared_nodes() -> None:
+    ir = IntermediateRepresentation(
+        flow_id="dangling",
+        name="Dangling",
+        version="1.0.0",
+        nodes=(IRNode("start", "Start", {}),),
+        edges=(
+            IREdge("e1", "start", "ghost", {}),
+            IREdge("e2", "ghost", "start", {}),
+        ),
+        metadata=IRMetadata(source_path=Path("dangling.json"), output_dir=Path("dist")),
+    )
+
+    analysis = analyze_flow(ir)
+
+    assert analysis.has_cycles is True
+    assert analysis.has_branching is False
+
+
+def test_recommend_target_matches_analysis() -> None:
+    for fixture_name in ("simple_passthrough.json", "price_deal_finder.json"):
+        document = parse_langflow_json(FIXTURE_DIR / fixture_name)
+        expected = analyze_flow(build_intermediate_representation(document)).recommended_target
+        assert recommend_target(document) is expected
@@ -1,13 +1,17 @@
 from __future__ import annotations
 
+import inspect
+import json
+import subprocess
+import sys
+from collections.abc import Callable
 from pathlib import Path
 
 import pytest
-import yaml
 from _pytest.capture import CaptureFixture
 
 from lf2x.__about__ import __version__
-from lf2x.cli import analyze, configure, convert, validate, version
+from lf2x.cli import _DEFAULT_OUTPUT_DIR, analyze, configure, convert, validate, version
 from lf2x.config import DEFAULT_OUTPUT_DIR
 
 
@@ -21,6 +25,38 @@ def test_version_function_outputs_version(capsys: CaptureFixture[str]) -> None:
     assert captured.out.strip() == __version__
 
 
+def test_version_command_does_not_import_yaml() -> None:
+    script = (
+        "import sys\n"
+        "from typer.testing import CliRunner\n"
+        "from lf2x.cli import app\n"
+        "assert CliRunner().invoke(app, ['version']).exit_code == 0\n"
+        "print('yaml' in sys.modules)\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "False"
+
+
+def test_cli_output_dir_default_matches_config() -> None:
+    assert Path(_DEFAULT_OUTPUT_DIR) == DEFAULT_OUTPUT_DIR
+
+
+@pytest.mark.parametrize(
+    ("command", "help_text"),
+    [
+        (configure, "Directory for generated artifacts"),
+        (convert, "Directory where generated artifacts will be written"),
+        (analyze, "Output directory used to resolve IR metadata"),
+    ],
+)
+def test_output_dir_help_is_specific_to_each_command(
+    command: Callable[..., None], help_text: str
+) -> None:
+    assert inspect.signature(command).parameters["output_dir"].default.help == help_text
+
+
 def test_configure_function_uses_defaults(capsys: CaptureFixture[str]) -> None:
     configure()
     captured = capsys.readouterr()
@@ -50,7 +86,7 @@ def test_configure_function_handles_explicit_config(
 def test_configure_loads_config_file_values(tmp_path: Path, capsys: CaptureFixture[str]) -> None:
     config_file = tmp_path / "lf2x.yaml"
     config_file.write_text(
-        yaml.safe_dump(
+        json.dumps(
             {
                 "paths": {"output_dir": "configured"},
                 "api": {"base_url": "https://config", "token": "secret"},
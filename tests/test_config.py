@@ -1,34 +1,36 @@
 from __future__ import annotations
 
+import json
 from pathlib import Path
 
-import yaml
+import pytest
 
+from lf2x import config
 from lf2x.config import DEFAULT_OUTPUT_DIR, LF2XSettings
 
 
-def test_from_sources_defaults(tmp_path: Path) -> None:
+def test_from_sources_defaults(path_root: Path) -> None:
     settings = LF2XSettings.from_sources()
     assert settings.output_dir == DEFAULT_OUTPUT_DIR
     assert settings.config_file is None
-    resolved = settings.resolve_output_dir(base_dir=tmp_path)
-    assert resolved == tmp_path / DEFAULT_OUTPUT_DIR
+    resolved = settings.resolve_output_dir(base_dir=path_root)
+    assert resolved == path_root / DEFAULT_OUTPUT_DIR
 
 
-def test_with_overrides_updates_values(tmp_path: Path) -> None:
-    base = LF2XSettings(output_dir=tmp_path / "base", api_base_url="https://api", api_token="abc")
+def test_with_overrides_updates_values(path_root: Path) -> None:
+    base = LF2XSettings(output_dir=path_root / "base", api_base_url="https://api", api_token="abc")
     updated = base.with_overrides(
         output_dir="alt",
-        config_file=tmp_path / "cfg.yaml",
+        config_file=path_root / "cfg.yaml",
         api_base_url="https://override",
         api_token="xyz",
     )
     assert updated.output_dir == Path("alt")
-    assert updated.config_file == tmp_path / "cfg.yaml"
+    assert updated.config_file == path_root / "cfg.yaml"
     assert updated.api_base_url == "https://override"
     assert updated.api_token == "xyz"
     # ensure resolve uses new paths while keeping relative directories isolated
-    assert updated.resolve_output_dir(base_dir=tmp_path) == tmp_path / "alt"
+    assert updated.resolve_output_dir(base_dir=path_root) == path_root / "alt"
 
 
 def test_from_sources_discovers_config_file(tmp_path: Path) -> None:
@@ -47,7 +49,7 @@ def test_from_sources_prefers_explicit_config(tmp_path: Path) -> None:
     assert settings.config_file == explicit
 
 
-def test_with_overrides_keeps_defaults(tmp_path: Path) -> None:
+def test_with_overrides_keeps_defaults() -> None:
     base = LF2XSettings()
     updated = base.with_overrides()
     assert updated.output_dir == DEFAULT_OUTPUT_DIR
@@ -56,23 +58,22 @@ def test_with_overrides_keeps_defaults(tmp_path: Path) -> None:
     assert updated.api_token is None
 
 
-def test_resolve_output_dir_behaviour(tmp_path: Path) -> None:
-    candidates: list[Path | None] = [None, Path("./relative"), Path("/absolute")]
-    for candidate in candidates:
-        settings = LF2XSettings.from_sources(output_dir=candidate)
-        resolved = settings.resolve_output_dir(base_dir=tmp_path)
-        if candidate is None:
-            assert resolved == tmp_path / DEFAULT_OUTPUT_DIR
-        elif candidate.is_absolute():
-            assert resolved == candidate
-        else:
-            assert resolved == tmp_path / candidate
+@pytest.mark.parametrize("candidate", [None, Path("./relative"), Path("/absolute")])
+def test_resolve_output_dir_behaviour(path_root: Path, candidate: Path | None) -> None:
+    settings = LF2XSettings.from_sources(output_dir=candidate)
+    resolved = settings.resolve_output_dir(base_dir=path_root)
+    if candidate is None:
+        assert resolved == path_root / DEFAULT_OUTPUT_DIR
+    elif candidate.is_absolute():
+        assert resolved == candidate
+    else:
+        assert resolved == path_root / candidate
 
 
 def test_from_sources_loads_yaml_configuration(tmp_path: Path) -> None:
     config_path = tmp_path / "lf2x.yaml"
     config_path.write_text(
-        yaml.safe_dump(
+        json.dumps(
             {
                 "paths": {"output_dir": "configured"},
                 "api": {"base_url": "https://langflow.local", "token": "abc123"},
@@ -89,7 +90,7 @@ def test_from_sources_loads_yaml_configuration(tmp_path: Path) -> None:
 def test_cli_overrides_config_file_values(tmp_path: Path) -> None:
     config_path = tmp_path / "lf2x.yaml"
     config_path.write_text(
-        yaml.safe_dump(
+        json.dumps(
             {
                 "paths": {"output_dir": "configured"},
                 "api": {"base_url": "https://config", "token": "config"},
@@ -106,3 +107,40 @@ def test_cli_overrides_config_file_values(tmp_path: Path) -> None:
     assert settings.api_base_url == "https://config"
     assert settings.api_token == "config"
     assert settings.config_file == config_path
+
+
+def test_from_sources_reloads_config_after_edit(tmp_path: Path) -> None:
+    config_path = tmp_path / "lf2x.yaml"
+    config_path.write_text(json.dumps({"api": {"base_url": "https://first"}}))
+    first = LF2XSettings.from_sources(config_file=config_path)
+    again = LF2XSettings.from_sources(config_file=config_path)
+    assert first.api_base_url == again.api_base_url == "https://first"
+
+    config_path.write_text(json.dumps({"api": {"base_url": "https://second-host"}}))
+    updated = LF2XSettings.from_sources(config_file=config_path)
+    assert updated.api_base_url == "https://second-host"
+
+
+def test_from_sources_leaves_no_files_beside_config(tmp_path: Path) -> None:
+    config_path = tmp_path / "lf2x.yaml"
+    config_path.write_text(json.dumps({"api": {"token": "secret"}}))
+    LF2XSettings.from_sources(config_file=config_path)
+    assert [path.name for path in tmp_path.iterdir()] == ["lf2x.yaml"]
+
+
+def test_from_sources_ignores_directories_named_like_config(tmp_path: Path) -> None:
+    (tmp_path / "lf2x.yaml").mkdir()
+    settings = LF2XSettings.from_sources(search_paths=[tmp_path / "missing", tmp_path])
+    assert settings.config_file is None
+
+
+def test_loaded_config_documents_are_read_only(tmp_path: Path) -> None:
+    config_path = tmp_path / "lf2x.yaml"
+    config_path.write_text(json.dumps({"paths": {"output_dir": "out"}, "flows": ["a"]}))
+
+    data = config._load_config(config_path)
+
+    assert data is config._load_config(config_path)
+    assert data["flows"] == ("a",)
+    with pytest.raises(TypeError):
+        data["paths"]["output_dir"] = "elsewhere"  # type: ignore[index]
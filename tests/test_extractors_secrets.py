@@ -42,3 +42,35 @@ def test_detect_secrets_is_idempotent() -> None:
     first = detect_secrets(ir)
     second = detect_secrets(ir)
     assert first == second
+
+
+def test_detect_secrets_matches_hints_case_insensitively() -> None:
+    nodes = (
+        IRNode("plain", "Node", {"model": "gpt", "temperature": 0.1}),
+        IRNode("upper", "Node", {"OpenAI_API_Key": "sk-test", "Token": "   "}),
+    )
+    ir = IntermediateRepresentation(
+        flow_id="MixedFlow",
+        name="Mixed",
+        version="1.0.0",
+        nodes=nodes,
+        edges=(),
+        metadata=IRMetadata(Path("flow.json"), Path("dist")),
+    )
+
+    secrets = detect_secrets(ir)
+
+    assert [secret.field for secret in secrets] == ["OpenAI_API_Key"]
+
+
+def test_detect_secrets_returns_empty_for_flows_without_hints() -> None:
+    ir = IntermediateRepresentation(
+        flow_id="PlainFlow",
+        name="Plain",
+        version="1.0.0",
+        nodes=(IRNode("only", "Node", {"model": "gpt"}),),
+        edges=(),
+        metadata=IRMetadata(Path("flow.json"), Path("dist")),
+    )
+
+    assert detect_secrets(ir) == ()
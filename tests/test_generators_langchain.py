@@ -1,74 +1,82 @@
 from __future__ import annotations
 
+from collections.abc import Callable
 from pathlib import Path
 
 import pytest
 
+from lf2x.generators import langchain
 from lf2x.generators.langchain import LangChainProject, generate_langchain_project
 from lf2x.ir import (
     IntermediateRepresentation,
     IRMetadata,
     IRNode,
-    build_intermediate_representation,
 )
-from lf2x.parser import parse_langflow_json
 
-FIXTURE_DIR = Path(__file__).parent / "fixtures" / "flows"
+_EXPECTED_FILES = (
+    "src/{package}/__init__.py",
+    "src/{package}/chains/main_chain.py",
+    "src/{package}/nodes/__init__.py",
+    "src/{package}/prompts/__init__.py",
+    "src/{package}/prompts/system_prompt.txt",
+    "src/{package}/tools/__init__.py",
+    "src/{package}/tools/base_tool.py",
+    "src/{package}/config/__init__.py",
+    "src/{package}/config/settings.py",
+    "src/{package}/cli.py",
+    "tests/smoke/test_flow.py",
+    "tests/unit/test_config.py",
+    "tests/unit/test_cli.py",
+    "pyproject.toml",
+    ".env.example",
+)
 
 
-def _build_ir(fixture_name: str) -> IntermediateRepresentation:
-    document = parse_langflow_json(FIXTURE_DIR / fixture_name)
-    return build_intermediate_representation(document)
+# One generated project backs every structure check in this module.
+@pytest.fixture(scope="module")
+def langchain_project(
+    tmp_path_factory: pytest.TempPathFactory, simple_passthrough_ir: IntermediateRepresentation
+) -> LangChainProject:
+    destination = tmp_path_factory.mktemp("langchain") / "app"
+    return generate_langchain_project(simple_passthrough_ir, destination=destination)
 
 
-def test_generate_langchain_project_creates_expected_structure(tmp_path: Path) -> None:
-    ir = _build_ir("simple_passthrough.json")
+def test_generate_langchain_project_emits_string_paths(
+    langchain_project: LangChainProject,
+) -> None:
+    # Plain strings are joined onto the writer root directly, with no per-file Path.
+    assert all(isinstance(file.relative_path, str) for file in langchain_project.files)
 
-    project = generate_langchain_project(ir, destination=tmp_path / "app")
 
-    assert isinstance(project, LangChainProject)
-    src_root = project.root / "src" / project.package_name
-    tests_root = project.root / "tests" / "smoke"
-
-    main_chain = src_root / "chains" / "main_chain.py"
-    init_file = src_root / "__init__.py"
-    nodes_init = src_root / "nodes" / "__init__.py"
-    prompts_dir = src_root / "prompts"
-    tools_dir = src_root / "tools"
-    config_dir = src_root / "config"
-    cli_module = src_root / "cli.py"
-    smoke_test = tests_root / "test_flow.py"
-    unit_config_test = project.root / "tests" / "unit" / "test_config.py"
-    unit_cli_test = project.root / "tests" / "unit" / "test_cli.py"
-    pyproject = project.root / "pyproject.toml"
-    env_file = project.root / ".env.example"
+@pytest.mark.parametrize("relative_path", _EXPECTED_FILES)
+def test_generate_langchain_project_writes_file(
+    langchain_project: LangChainProject, relative_path: str
+) -> None:
+    target = langchain_project.root / relative_path.format(package=langchain_project.package_name)
+
+    assert target.is_file()
+
+
+def test_generate_langchain_project_creates_expected_structure(
+    langchain_project: LangChainProject,
+    simple_passthrough_ir: IntermediateRepresentation,
+    generated_text: Callable[[LangChainProject, str], str],
+) -> None:
+    ir = simple_passthrough_ir
+    project = langchain_project
 
-    assert main_chain.exists()
-    assert init_file.exists()
-    assert nodes_init.exists()
-    assert (prompts_dir / "__init__.py").exists()
-    assert (prompts_dir / "system_prompt.txt").exists()
-    assert (tools_dir / "__init__.py").exists()
-    assert (tools_dir / "base_tool.py").exists()
-    assert (config_dir / "__init__.py").exists()
-    assert (config_dir / "settings.py").exists()
-    assert cli_module.exists()
-    assert smoke_test.exists()
-    assert unit_config_test.exists()
-    assert unit_cli_test.exists()
-    assert pyproject.exists()
-
-    main_chain_content = main_chain.read_text()
+    assert isinstance(project, LangChainProject)
+    package_src = f"src/{project.package_name}"
+    main_chain_content = generated_text(project, f"{package_src}/chains/main_chain.py")
     assert ir.flow_id in main_chain_content
     assert "LangChain" in main_chain_content
 
-    smoke_content = smoke_test.read_text()
+    smoke_content = generated_text(project, "tests/smoke/test_flow.py")
     assert "main_chain" in smoke_content
-    assert "langchain" in pyproject.read_text().lower()
-    system_prompt = (prompts_dir / "system_prompt.txt").read_text()
+    assert "langchain" in generated_text(project, "pyproject.toml").lower()
+    system_prompt = (project.root / package_src / "prompts" / "system_prompt.txt").read_text()
     assert ir.name or ir.flow_id in system_prompt
-    assert env_file.exists()
-    assert "No secrets detected" in env_file.read_text()
+    assert "No secrets detected" in (project.root / ".env.example").read_text()
 
     statuses = {entry.status for entry in project.writes}
     assert "created" in statuses
@@ -96,10 +104,27 @@ def test_generate_langchain_project_extracts_secrets(tmp_path: Path) -> None:
     assert "SECRETFLOW_PROVIDER_API_KEY" in env_file.read_text()
     settings_content = settings_file.read_text()
     assert "secretflow_provider_api_key" in settings_content
+    assert "sk-test" not in repr(list(langchain._FILES_CACHE))
 
 
-def test_generate_langchain_project_rejects_branching_flows(tmp_path: Path) -> None:
-    branching_ir = _build_ir("price_deal_finder.json")
+def test_generate_langchain_project_rejects_branching_flows(
+    path_root: Path, price_deal_finder_ir: IntermediateRepresentation
+) -> None:
+    branching_ir = price_deal_finder_ir
 
     with pytest.raises(ValueError, match="LangGraph"):
-        generate_langchain_project(branching_ir, destination=tmp_path / "app")
+        generate_langchain_project(branching_ir, destination=path_root / "app")
+
+
+def test_generate_langchain_project_reuses_rendered_files(
+    tmp_path: Path, simple_passthrough_ir: IntermediateRepresentation
+) -> None:
+    ir = simple_passthrough_ir
+
+    first = generate_langchain_project(ir, destination=tmp_path / "first")
+    second = generate_langchain_project(ir, destination=tmp_path / "second")
+
+    assert [write.status for write in second.writes] == [write.status for write in first.writes]
+    for write in first.writes:
+        relative = write.path.relative_to(first.root)
+        assert (second.root / relative).read_text() == write.path.read_text()
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Callable
 from pathlib import Path
 
 import pytest
@@ -47,7 +48,9 @@ def _make_branching_ir() -> IntermediateRepresentation:
     )
 
 
-def test_generate_langgraph_project_creates_structure(tmp_path: Path) -> None:
+def test_generate_langgraph_project_creates_structure(
+    tmp_path: Path, generated_text: Callable[[LangGraphProject, str], str]
+) -> None:
     ir = _make_branching_ir()
 
     project = generate_langgraph_project(ir, destination=tmp_path / "app")
@@ -85,13 +88,14 @@ def test_generate_langgraph_project_creates_structure(tmp_path: Path) -> None:
     assert unit_cli_test.exists()
     assert pyproject.exists()
 
-    graph_content = graph_module.read_text()
+    assert all(isinstance(file.relative_path, str) for file in project.files)
+    graph_content = generated_text(project, f"src/{project.package_name}/graphs/main_graph.py")
     assert ir.flow_id in graph_content
     assert "StateGraph" in graph_content
 
-    smoke_content = smoke_test.read_text()
+    smoke_content = generated_text(project, "tests/smoke/test_flow.py")
     assert "main_graph" in smoke_content
-    assert "langgraph" in pyproject.read_text().lower()
+    assert "langgraph" in generated_text(project, "pyproject.toml").lower()
     assert env_file.exists()
     assert "No secrets detected" in env_file.read_text()
 
@@ -132,8 +136,36 @@ def test_generate_langgraph_project_extracts_secrets(tmp_path: Path) -> None:
     assert "secretgraph_start_api_secret" in settings_content
 
 
-def test_generate_langgraph_project_rejects_linear_flows(tmp_path: Path) -> None:
+def test_generate_langgraph_project_rejects_linear_flows(path_root: Path) -> None:
     ir = _make_linear_ir()
 
     with pytest.raises(ValueError, match="LangChain"):
-        generate_langgraph_project(ir, destination=tmp_path / "app")
+        generate_langgraph_project(ir, destination=path_root / "app")
+
+
+def test_generate_langgraph_project_quotes_unusual_node_ids(tmp_path: Path) -> None:
+    nodes = (
+        IRNode("start", "Start", {}),
+        IRNode("it's", "Left", {}),
+        IRNode("back\\slash", "Right", {}),
+    )
+    edges = (
+        IREdge("e1", "start", "it's", {}),
+        IREdge("e2", "start", "back\\slash", {}),
+    )
+    ir = IntermediateRepresentation(
+        flow_id="quoted",
+        name="Quoted",
+        version="1.0.0",
+        nodes=nodes,
+        edges=edges,
+        metadata=IRMetadata(Path("quoted.json"), Path("dist")),
+    )
+
+    project = generate_langgraph_project(ir, destination=tmp_path / "app")
+
+    main_graph = project.root / "src" / project.package_name / "graphs" / "main_graph.py"
+    content = main_graph.read_text()
+    assert repr("it's") in content
+    assert "('start', 'back\\\\slash')" in content
+    compile(content, str(main_graph), "exec")
@@ -93,3 +93,39 @@ def test_writer_dry_run(tmp_path: Path) -> None:
 
     assert results == [WriteResult(path=tmp_path / "README.md", status="would-create", todos=())]
     assert not (tmp_path / "README.md").exists()
+
+
+def test_writer_accepts_pre_encoded_content(tmp_path: Path) -> None:
+    writer = ProjectScaffoldWriter(tmp_path)
+    file = GeneratedFile(Path("src") / "module.py", b"print('hi')", todos=("review logic",))
+
+    first = writer.write_files([file])
+    second = writer.write_files([file])
+
+    target = tmp_path / "src" / "module.py"
+    assert [result.status for result in first + second] == ["created", "unchanged"]
+    assert target.read_bytes() == b"# TODO(lf2x): review logic\n\nprint('hi')\n"
+
+
+def test_writer_detects_same_size_changes(tmp_path: Path) -> None:
+    target = tmp_path / "README.md"
+    target.write_text("before\n")
+    writer = ProjectScaffoldWriter(tmp_path)
+
+    with pytest.raises(OverwriteError):
+        writer.write_files([GeneratedFile(Path("README.md"), "after!\n")])
+
+
+def test_generated_file_is_frozen() -> None:
+    file = GeneratedFile("src/app.py", "print('hi')\n")
+
+    assert file.relative_path == "src/app.py"
+    with pytest.raises(AttributeError):
+        file.content = "changed"  # type: ignore[misc]
+
+
+def test_writer_rejects_absolute_paths(tmp_path: Path) -> None:
+    writer = ProjectScaffoldWriter(tmp_path)
+
+    with pytest.raises(ValueError, match="relative paths"):
+        writer.write_files([GeneratedFile(tmp_path / "README.md", "# Demo\n")])
@@ -2,7 +2,6 @@ from __future__ import annotations
 
 from pathlib import Path
 
-from lf2x.config import LF2XSettings
 from lf2x.ir import (
     IntermediateRepresentation,
     IREdge,
@@ -15,11 +14,10 @@ from lf2x.parser import parse_langflow_json
 FIXTURE_DIR = Path(__file__).parent / "fixtures" / "flows"
 
 
-def test_build_ir_from_parsed_document(tmp_path: Path) -> None:
+def test_build_ir_from_parsed_document() -> None:
     fixture = FIXTURE_DIR / "simple_passthrough.json"
-    settings = LF2XSettings.from_sources(output_dir=tmp_path / "out")
 
-    document = parse_langflow_json(fixture, settings=settings)
+    document = parse_langflow_json(fixture)
     ir = build_intermediate_representation(document)
 
     assert isinstance(ir, IntermediateRepresentation)
@@ -34,7 +32,7 @@ def test_build_ir_from_parsed_document(tmp_path: Path) -> None:
     )
 
 
-def test_ir_nodes_and_edges_are_copies(tmp_path: Path) -> None:
+def test_ir_nodes_and_edges_share_document_data() -> None:
     fixture = FIXTURE_DIR / "simple_passthrough.json"
 
     document = parse_langflow_json(fixture)
@@ -43,18 +41,20 @@ def test_ir_nodes_and_edges_are_copies(tmp_path: Path) -> None:
     assert all(isinstance(node, IRNode) for node in ir.nodes)
     assert all(isinstance(edge, IREdge) for edge in ir.edges)
 
-    # Ensure dictionaries are copied, not referenced
+    # Data mappings are built once by the parser and shared between the document and the IR
     for doc_node, ir_node in zip(document.nodes, ir.nodes, strict=True):
-        assert doc_node.data == ir_node.data
-        assert doc_node.data is not ir_node.data
+        assert ir_node.data is doc_node.data
     for doc_edge, ir_edge in zip(document.edges, ir.edges, strict=True):
-        assert doc_edge.data == ir_edge.data
-        assert doc_edge.data is not ir_edge.data
+        assert ir_edge.data is doc_edge.data
 
 
-def test_ir_helper_methods(tmp_path: Path) -> None:
+def test_ir_helper_methods() -> None:
     document = parse_langflow_json(FIXTURE_DIR / "simple_passthrough.json")
     ir = build_intermediate_representation(document)
 
     assert ir.node_ids() == {node.node_id for node in ir.nodes}
     assert ir.edge_ids() == {edge.edge_id for edge in ir.edges}
+    assert ir.node_ids() is ir.node_ids()
+    assert isinstance(ir.edge_ids(), frozenset)
+    assert ir.ordered_node_ids() == tuple(node.node_id for node in ir.nodes)
+    assert ir.edge_pairs() == tuple((edge.source, edge.target) for edge in ir.edges)
@@ -4,6 +4,7 @@ from pathlib import Path
 
 import pytest
 
+from lf2x import mapping_registry
 from lf2x.mapping_registry import ComponentMapping, ComponentRegistry, load_registry
 
 
@@ -55,3 +56,29 @@ def test_registry_invalid_format_raises(tmp_path: Path) -> None:
 
     with pytest.raises(ValueError, match="Invalid component registry format"):
         ComponentRegistry(registry_path)
+
+
+def test_registry_reloads_after_edit(tmp_path: Path) -> None:
+    registry_path = tmp_path / "components.yaml"
+    registry_path.write_text("- type: First\n  supported: true\n  target: langchain\n")
+    assert ComponentRegistry(registry_path).is_supported("First") is True
+
+    registry_path.write_text("- type: Second\n  supported: true\n  target: langgraph\n")
+    registry = ComponentRegistry(registry_path)
+
+    assert registry.get("First") is None
+    assert registry.suggested_target("Second") == "langgraph"
+
+
+def test_registry_reuses_parsed_entries_in_memory(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    registry_path = tmp_path / "components.yaml"
+    registry_path.write_text("- type: Cached\n  supported: true\n  target: langchain\n")
+    ComponentRegistry(registry_path)
+
+    monkeypatch.setattr(mapping_registry, "safe_load", pytest.fail)
+    registry = ComponentRegistry(registry_path)
+
+    assert registry.is_supported("Cached") is True
+    assert [path.name for path in tmp_path.iterdir()] == ["components.yaml"]
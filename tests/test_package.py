@@ -1,3 +1,6 @@
+import pytest
+
+import lf2x
 from lf2x import DEFAULT_OUTPUT_DIR, LF2XSettings, __version__
 
 
@@ -7,3 +10,10 @@ def test_public_api_exports() -> None:
     settings = LF2XSettings()
     assert settings.output_dir == DEFAULT_OUTPUT_DIR
     assert settings.config_file is None
+
+
+def test_public_api_resolves_lazy_exports() -> None:
+    for name in lf2x.__all__:
+        assert getattr(lf2x, name) is not None
+    with pytest.raises(AttributeError, match="no_such_export"):
+        lf2x.no_such_export  # noqa: B018
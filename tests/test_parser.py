@@ -1,14 +1,24 @@
 from __future__ import annotations
 
+import copy
 import json
+import math
+import pickle
 from collections.abc import Callable
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any, TypeVar, cast
 
 import pytest
 
+from lf2x import parser
 from lf2x.config import DEFAULT_OUTPUT_DIR, LF2XSettings
-from lf2x.parser import LangFlowDocument, UnsupportedFlowVersionError, parse_langflow_json
+from lf2x.parser import (
+    LangFlowDocument,
+    UnsupportedFlowVersionError,
+    parse_langflow_dict,
+    parse_langflow_json,
+)
 
 F = TypeVar("F", bound=Callable[..., Any])
 
@@ -20,9 +30,9 @@ def typed_parametrize(*args: Any, **kwargs: Any) -> Callable[[F], F]:
 FIXTURE_DIR = Path(__file__).parent / "fixtures" / "flows"
 
 
-def test_parse_langflow_json_returns_document(tmp_path: Path) -> None:
+def test_parse_langflow_json_returns_document(path_root: Path) -> None:
     fixture = FIXTURE_DIR / "simple_passthrough.json"
-    target_dir = tmp_path / "artifacts"
+    target_dir = path_root / "artifacts"
     settings = LF2XSettings.from_sources(output_dir=target_dir)
 
     document = parse_langflow_json(fixture, settings=settings)
@@ -37,7 +47,15 @@ def test_parse_langflow_json_returns_document(tmp_path: Path) -> None:
     assert document.metadata.output_dir == target_dir
 
 
-def test_parse_langflow_json_defaults_output_dir_when_not_provided(tmp_path: Path) -> None:
+def test_parsed_document_round_trips_through_pickle_and_deepcopy() -> None:
+    document = parse_langflow_json(FIXTURE_DIR / "simple_passthrough.json")
+
+    assert pickle.loads(pickle.dumps(document)) == document
+    assert copy.deepcopy(document) == document
+    assert json.loads(json.dumps(document.nodes[0].data)) == document.nodes[0].data
+
+
+def test_parse_langflow_json_defaults_output_dir_when_not_provided() -> None:
     fixture = FIXTURE_DIR / "simple_passthrough.json"
     settings = LF2XSettings()  # defaults to dist/
 
@@ -47,52 +65,63 @@ def test_parse_langflow_json_defaults_output_dir_when_not_provided(tmp_path: Pat
 
 
 @typed_parametrize("version", ["0.9.0", "2.0.0"])
-def test_parse_langflow_json_rejects_unsupported_versions(version: str, tmp_path: Path) -> None:
-    fixture = tmp_path / "unsupported.json"
-    fixture.write_text(
-        json.dumps(
-            {
-                "id": "flow-legacy",
-                "name": "Legacy Flow",
-                "last_tested_version": version,
-                "data": {
-                    "nodes": [],
-                    "edges": [],
-                },
-            }
-        )
-    )
+def test_parse_langflow_dict_rejects_unsupported_versions(version: str) -> None:
+    payload = {
+        "id": "flow-legacy",
+        "name": "Legacy Flow",
+        "last_tested_version": version,
+        "data": {
+            "nodes": [],
+            "edges": [],
+        },
+    }
 
     with pytest.raises(UnsupportedFlowVersionError, match=version):
-        parse_langflow_json(fixture)
+        parse_langflow_dict(payload)
 
 
-@typed_parametrize("missing_field", ["id", "name", "version", "nodes", "edges"])
-def test_parse_langflow_json_validates_required_fields(missing_field: str, tmp_path: Path) -> None:
-    payload: dict[str, Any] = {
+def test_parse_langflow_json_rejects_unsupported_version_files(tmp_path: Path) -> None:
+    source = tmp_path / "legacy.json"
+    payload = {
         "id": "flow",
         "name": "Flow",
-        "last_tested_version": "1.5.1",
-        "data": {
-            "nodes": [],
-            "edges": [],
-        },
+        "last_tested_version": "0.9.0",
+        "nodes": [],
+        "edges": [],
     }
-    if missing_field in {"nodes", "edges"}:
-        payload["data"].pop(missing_field)
-    elif missing_field == "version":
-        payload.pop("last_tested_version")
-    else:
-        payload.pop(missing_field)
+    source.write_text(json.dumps(payload))
+
+    with pytest.raises(UnsupportedFlowVersionError, match="0.9.0"):
+        parse_langflow_json(source)
+
 
-    fixture = tmp_path / "invalid.json"
-    fixture.write_text(json.dumps(payload))
+_REQUIRED_FIELDS = MappingProxyType({"id": "flow", "name": "Flow", "last_tested_version": "1.5.1"})
 
+
+def _payload_without(missing_field: str) -> dict[str, Any]:
+    key = "last_tested_version" if missing_field == "version" else missing_field
+    # Filter the shared base instead of copying a full literal and popping from it.
+    payload: dict[str, Any] = {k: v for k, v in _REQUIRED_FIELDS.items() if k != key}
+    payload["data"] = {field: [] for field in ("nodes", "edges") if field != key}
+    return payload
+
+
+# Payloads are built once at collection time; the parser never mutates its input.
+_MISSING_FIELD_CASES = [
+    pytest.param(_payload_without(field), field, id=field)
+    for field in ("id", "name", "version", "nodes", "edges")
+]
+
+
+@typed_parametrize(("payload", "missing_field"), _MISSING_FIELD_CASES)
+def test_parse_langflow_dict_validates_required_fields(
+    payload: dict[str, Any], missing_field: str
+) -> None:
     with pytest.raises(ValueError, match=missing_field):
-        parse_langflow_json(fixture)
+        parse_langflow_dict(payload)
 
 
-def test_parse_langflow_json_uses_inner_node_type(tmp_path: Path) -> None:
+def test_parse_langflow_dict_uses_inner_node_type() -> None:
     payload = {
         "id": "flow",
         "name": "Flow",
@@ -105,83 +134,69 @@ def test_parse_langflow_json_uses_inner_node_type(tmp_path: Path) -> None:
         ],
         "edges": [],
     }
-    fixture = tmp_path / "inner_type.json"
-    fixture.write_text(json.dumps(payload))
 
-    document = parse_langflow_json(fixture)
+    document = parse_langflow_dict(payload)
 
     node = document.nodes[0]
     assert node.type == "InnerType"
 
 
-def test_parse_langflow_json_rejects_non_list_nodes(tmp_path: Path) -> None:
+@typed_parametrize(
+    ("overrides", "match"),
+    [
+        ({"nodes": {}}, "'nodes' must be a list"),
+        (
+            {"nodes": [{"id": "node-1", "type": "Test", "data": "not-a-dict"}]},
+            "Node 'data' must be a mapping",
+        ),
+        ({"edges": {}}, "'edges' must be a list"),
+        (
+            {
+                "edges": [
+                    {"id": "edge-1", "source": "node-a", "target": "node-b", "data": "not-a-dict"}
+                ]
+            },
+            "Edge 'data' must be a mapping",
+        ),
+    ],
+)
+def test_parse_langflow_dict_rejects_malformed_graph(overrides: dict[str, Any], match: str) -> None:
     payload = {
         "id": "flow",
         "name": "Flow",
         "last_tested_version": "1.5.1",
-        "nodes": {},
+        "nodes": [],
         "edges": [],
+        **overrides,
     }
-    fixture = tmp_path / "invalid_nodes.json"
-    fixture.write_text(json.dumps(payload))
 
-    with pytest.raises(ValueError, match="'nodes' must be a list"):
-        parse_langflow_json(fixture)
+    with pytest.raises(ValueError, match=match):
+        parse_langflow_dict(payload)
 
 
-def test_parse_langflow_json_rejects_invalid_node_data(tmp_path: Path) -> None:
-    payload = {
-        "id": "flow",
-        "name": "Flow",
-        "last_tested_version": "1.5.1",
-        "nodes": [
-            {
-                "id": "node-1",
-                "type": "Test",
-                "data": "not-a-dict",
-            }
-        ],
-        "edges": [],
-    }
-    fixture = tmp_path / "invalid_node_data.json"
-    fixture.write_text(json.dumps(payload))
+def test_parse_langflow_json_without_orjson(monkeypatch: pytest.MonkeyPatch) -> None:
+    fixture = FIXTURE_DIR / "simple_passthrough.json"
+    expected = parse_langflow_json(fixture)
+    monkeypatch.setattr(parser, "orjson", None)
 
-    with pytest.raises(ValueError, match="Node 'data' must be a mapping"):
-        parse_langflow_json(fixture)
+    assert parse_langflow_json(fixture) == expected
 
 
-def test_parse_langflow_json_rejects_invalid_edges(tmp_path: Path) -> None:
-    payload = {
-        "id": "flow",
-        "name": "Flow",
-        "last_tested_version": "1.5.1",
-        "nodes": [],
-        "edges": {},
-    }
-    fixture = tmp_path / "invalid_edges.json"
-    fixture.write_text(json.dumps(payload))
+def test_parse_langflow_json_accepts_non_finite_and_wide_numbers() -> None:
+    document = parse_langflow_json(FIXTURE_DIR / "non_finite_values.json")
 
-    with pytest.raises(ValueError, match="'edges' must be a list"):
-        parse_langflow_json(fixture)
+    data = document.nodes[0].data
+    assert math.isnan(data["threshold"])
+    assert data["ceiling"] == math.inf
+    assert data["seed"] == 123456789012345678901234567890
 
 
-def test_parse_langflow_json_rejects_invalid_edge_data(tmp_path: Path) -> None:
-    payload = {
-        "id": "flow",
-        "name": "Flow",
-        "last_tested_version": "1.5.1",
-        "nodes": [],
-        "edges": [
-            {
-                "id": "edge-1",
-                "source": "node-a",
-                "target": "node-b",
-                "data": "not-a-dict",
-            }
-        ],
-    }
-    fixture = tmp_path / "invalid_edge_data.json"
-    fixture.write_text(json.dumps(payload))
+def test_parse_langflow_json_memory_maps_large_exports(monkeypatch: pytest.MonkeyPatch) -> None:
+    pytest.importorskip("orjson")
+    fixture = FIXTURE_DIR / "simple_passthrough.json"
+    expected = parse_langflow_json(fixture)
+    monkeypatch.setattr(parser, "_MMAP_THRESHOLD", 1)
 
-    with pytest.raises(ValueError, match="Edge 'data' must be a mapping"):
-        parse_langflow_json(fixture)
+    assert parse_langflow_json(fixture) == expected
+    non_finite = parse_langflow_json(FIXTURE_DIR / "non_finite_values.json")
+    assert math.isnan(non_finite.nodes[0].data["threshold"])
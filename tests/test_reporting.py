@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from lf2x import reporting
+from lf2x.analyzer import TargetRecommendation
+from lf2x.generators.project import WriteResult
+from lf2x.reporting import write_conversion_report
+
+
+def _write_report(tmp_path: Path) -> str:
+    artifacts = write_conversion_report(
+        flow_id="flüx",
+        target=TargetRecommendation.LANGCHAIN,
+        project_root=tmp_path,
+        writes=[
+            WriteResult(tmp_path / "README.md", "created"),
+            WriteResult(tmp_path / "src" / "app.py", "unchanged", todos=("wire tools",)),
+            WriteResult(tmp_path / "docs" / "überblick.md", "created", todos=("übersetzen",)),
+        ],
+    )
+    return artifacts.json.read_text(encoding="utf-8")
+
+
+def test_json_report_matches_stdlib_rendering(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    rendered = _write_report(tmp_path)
+    monkeypatch.setattr(reporting, "orjson", None)
+    fallback = _write_report(tmp_path)
+
+    assert rendered == fallback
+    assert '"flow_id": "flüx"' in rendered
+    payload = json.loads(rendered)
+    assert payload["counts"] == {"created": 2, "unchanged": 1}
+    assert payload["files"][1] == {
+        "path": "src/app.py",
+        "status": "unchanged",
+        "todos": ["wire tools"],
+    }
+
+
+def test_rendered_json_bytes_are_raw_utf8_with_and_without_orjson(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    report = reporting.build_report(
+        flow_id="flüx",
+        target=TargetRecommendation.LANGGRAPH,
+        project_root=tmp_path,
+        writes=[WriteResult(tmp_path / "naïve.py", "created", todos=("café",))],
+    )
+    encoded = reporting._render_artifacts(report)[1]
+    monkeypatch.setattr(reporting, "orjson", None)
+
+    assert reporting._render_artifacts(report)[1] == encoded
+    assert "flüx".encode() in encoded
+    assert b"\\u" not in encoded
+
+
+def test_report_to_dict_matches_json_payload(tmp_path: Path) -> None:
+    report = reporting.build_report(
+        flow_id="flow",
+        target=TargetRecommendation.LANGGRAPH,
+        project_root=tmp_path,
+        writes=[
+            WriteResult(tmp_path / "a.py", "created"),
+            WriteResult(tmp_path / "b.py", "created"),
+        ],
+    )
+
+    payload = report.to_dict()
+
+    assert payload["counts"] == {"created": 2}
+    assert payload["files"][0] == report.entries[0].to_dict()
+    assert json.loads(reporting._render_artifacts(report)[1]) == payload
+
+
+def test_conversion_report_counts_default_from_entries(tmp_path: Path) -> None:
+    report = reporting.ConversionReport(
+        flow_id="flow",
+        target=TargetRecommendation.LANGCHAIN,
+        project_root=tmp_path,
+        entries=(
+            reporting.ReportEntry(Path("a.py"), "created", ()),
+            reporting.ReportEntry(Path("b.py"), "created", ()),
+        ),
+    )
+
+    assert report.counts == {"created": 2}
+    assert report.counts["updated"] == 0
+    assert (
+        reporting.build_report(
+            flow_id="flow", target=TargetRecommendation.LANGCHAIN, project_root=tmp_path, writes=()
+        ).counts["created"]
+        == 0
+    )
+
+
+def test_build_report_relativizes_paths_under_the_root(tmp_path: Path) -> None:
+    outside = tmp_path.parent / "elsewhere.md"
+    report = reporting.build_report(
+        flow_id="flow",
+        target=TargetRecommendation.LANGCHAIN,
+        project_root=tmp_path / "project",
+        writes=[
+            WriteResult(tmp_path / "project" / "src" / "app.py", "created"),
+            WriteResult(tmp_path / "project" / "src" / ".." / "README.md", "created"),
+            WriteResult(outside, "created"),
+        ],
+    )
+
+    assert [entry.path for entry in report.entries] == [
+        Path("src/app.py"),
+        Path("README.md"),
+        outside,
+    ]
@@ -1,12 +1,17 @@
 from __future__ import annotations
 
+import asyncio
 import json
+import math
 import os
+from collections.abc import Iterator
 from pathlib import Path
+from types import MappingProxyType
 
 import httpx
 import pytest
 
+from lf2x import rest_client
 from lf2x.config import LF2XSettings
 from lf2x.ir import IntermediateRepresentation
 from lf2x.parser import LangFlowDocument
@@ -20,23 +25,76 @@ from lf2x.rest_client import (
 )
 
 FIXTURE_DIR = Path(__file__).parent / "fixtures" / "flows"
-PAYLOAD = json.loads((FIXTURE_DIR / "simple_passthrough.json").read_text())
+PAYLOAD_BYTES = (FIXTURE_DIR / "simple_passthrough.json").read_bytes()
+PAYLOAD = json.loads(PAYLOAD_BYTES)
+_JSON_HEADERS = {"content-type": "application/json"}
+
+
+def _payload_response(_request: httpx.Request) -> httpx.Response:
+    # Serve the fixture bytes as-is instead of re-encoding PAYLOAD per request.
+    return httpx.Response(200, content=PAYLOAD_BYTES, headers=_JSON_HEADERS)
+
+
+# MockTransport holds no per-request state, so the common scenarios are built once.
+_PAYLOAD_TRANSPORT = httpx.MockTransport(_payload_response)
+_AUTH_FAIL_TRANSPORT = httpx.MockTransport(
+    lambda request: httpx.Response(401, json={"detail": "invalid"})
+)
+_NOT_FOUND_TRANSPORT = httpx.MockTransport(
+    lambda request: httpx.Response(404, json={"detail": "missing"})
+)
+_SERVER_ERROR_TRANSPORT = httpx.MockTransport(lambda request: httpx.Response(500, text="boom"))
+
+
+# The client only reads output_dir from settings, so one instance serves the module.
+@pytest.fixture(scope="module")
+def settings(tmp_path_factory: pytest.TempPathFactory) -> LF2XSettings:
+    return LF2XSettings.from_sources(output_dir=tmp_path_factory.mktemp("rest") / "out")
 
 
 def test_fetch_flow_json_success() -> None:
-    transport = httpx.MockTransport(lambda request: httpx.Response(200, json=PAYLOAD))
-    client = LangFlowClient("https://langflow.example", token="secret", transport=transport)
+    client = LangFlowClient(
+        "https://langflow.example", token="secret", transport=_PAYLOAD_TRANSPORT
+    )
 
     data = client.fetch_flow_json("flow")
 
     assert data["id"] == PAYLOAD["id"]
 
 
-def test_fetch_flow_document_returns_document(tmp_path: Path) -> None:
-    transport = httpx.MockTransport(lambda request: httpx.Response(200, json=PAYLOAD))
-    settings = LF2XSettings.from_sources(output_dir=tmp_path / "out")
+def test_one_shot_fetch_returns_payload() -> None:
+    data = LangFlowClient.one_shot_fetch(
+        "https://langflow.example", "flow", transport=_PAYLOAD_TRANSPORT
+    )
+
+    assert data["id"] == PAYLOAD["id"]
+
+
+def test_fetch_flow_json_decodes_without_orjson(monkeypatch: pytest.MonkeyPatch) -> None:
+    client = LangFlowClient("https://langflow.example", transport=_PAYLOAD_TRANSPORT)
+    fast = client.fetch_flow_json("flow")
+
+    monkeypatch.setattr(rest_client, "orjson", None)
+
+    assert client.fetch_flow_json("flow") == fast
+
+
+def test_fetch_flow_json_accepts_non_finite_and_wide_numbers() -> None:
+    body = b'{"id": "flow", "score": NaN, "seed": 123456789012345678901234567890}'
+    transport = httpx.MockTransport(
+        lambda request: httpx.Response(200, content=body, headers=_JSON_HEADERS)
+    )
     client = LangFlowClient("https://langflow.example", transport=transport)
 
+    data = client.fetch_flow_json("flow")
+
+    assert math.isnan(data["score"])
+    assert data["seed"] == 123456789012345678901234567890
+
+
+def test_fetch_flow_document_returns_document(settings: LF2XSettings) -> None:
+    client = LangFlowClient("https://langflow.example", transport=_PAYLOAD_TRANSPORT)
+
     document = client.fetch_flow_document(PAYLOAD["id"], settings=settings)
 
     assert isinstance(document, LangFlowDocument)
@@ -44,10 +102,8 @@ def test_fetch_flow_document_returns_document(tmp_path: Path) -> None:
     assert document.metadata.output_dir == settings.resolve_output_dir()
 
 
-def test_fetch_ir_returns_intermediate_representation(tmp_path: Path) -> None:
-    transport = httpx.MockTransport(lambda request: httpx.Response(200, json=PAYLOAD))
-    settings = LF2XSettings.from_sources(output_dir=tmp_path / "out")
-    client = LangFlowClient("https://langflow.example", transport=transport)
+def test_fetch_ir_returns_intermediate_representation(settings: LF2XSettings) -> None:
+    client = LangFlowClient("https://langflow.example", transport=_PAYLOAD_TRANSPORT)
 
     ir = client.fetch_ir(PAYLOAD["id"], settings=settings)
 
@@ -55,25 +111,36 @@ def test_fetch_ir_returns_intermediate_representation(tmp_path: Path) -> None:
     assert ir.flow_id == PAYLOAD["id"]
 
 
-def test_fetch_flow_json_raises_for_auth_failure() -> None:
-    transport = httpx.MockTransport(lambda request: httpx.Response(401, json={"detail": "invalid"}))
+def test_fetch_ir_reuses_ir_for_unchanged_payloads(settings: LF2XSettings) -> None:
+    bodies = [PAYLOAD, PAYLOAD, {**PAYLOAD, "name": "Renamed"}]
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, json=bodies.pop(0)))
     client = LangFlowClient("https://langflow.example", transport=transport)
 
+    first = client.fetch_ir(PAYLOAD["id"], settings=settings)
+    second = client.fetch_ir(PAYLOAD["id"], settings=settings)
+    renamed = client.fetch_ir(PAYLOAD["id"], settings=settings)
+
+    assert second is first
+    assert renamed is not first
+    assert renamed.name == "Renamed"
+
+
+def test_fetch_flow_json_raises_for_auth_failure() -> None:
+    client = LangFlowClient("https://langflow.example", transport=_AUTH_FAIL_TRANSPORT)
+
     with pytest.raises(LangFlowAuthError):
         client.fetch_flow_json("flow")
 
 
 def test_fetch_flow_json_raises_for_not_found() -> None:
-    transport = httpx.MockTransport(lambda request: httpx.Response(404, json={"detail": "missing"}))
-    client = LangFlowClient("https://langflow.example", transport=transport)
+    client = LangFlowClient("https://langflow.example", transport=_NOT_FOUND_TRANSPORT)
 
     with pytest.raises(LangFlowNotFoundError):
         client.fetch_flow_json("missing")
 
 
 def test_fetch_flow_json_raises_for_other_errors() -> None:
-    transport = httpx.MockTransport(lambda request: httpx.Response(500, text="boom"))
-    client = LangFlowClient("https://langflow.example", transport=transport)
+    client = LangFlowClient("https://langflow.example", transport=_SERVER_ERROR_TRANSPORT)
 
     with pytest.raises(LangFlowAPIError):
         client.fetch_flow_json("flow")
@@ -83,15 +150,15 @@ def test_authorization_header_is_sent() -> None:
     captured_headers: dict[str, str] = {}
 
     def handler(request: httpx.Request) -> httpx.Response:
-        captured_headers.update(dict(request.headers))
-        return httpx.Response(200, json=PAYLOAD)
+        captured_headers["authorization"] = request.headers.get("authorization", "")
+        return _payload_response(request)
 
     transport = httpx.MockTransport(handler)
     client = LangFlowClient("https://langflow.example", token="secret-token", transport=transport)
 
     client.fetch_flow_json("flow")
 
-    assert captured_headers.get("authorization") == "Bearer secret-token"
+    assert captured_headers["authorization"] == "Bearer secret-token"
 
 
 def test_list_flows_returns_page() -> None:
@@ -131,8 +198,7 @@ def test_iter_flow_summaries_handles_pagination() -> None:
     ]
 
     def handler(request: httpx.Request) -> httpx.Response:
-        params = dict(request.url.params)
-        offset = int(params.get("offset", 0))
+        offset = int(request.url.params.get("offset", 0))
         index = offset if offset < len(responses) else len(responses) - 1
         return httpx.Response(200, json=responses[index])
 
@@ -140,22 +206,30 @@ def test_iter_flow_summaries_handles_pagination() -> None:
     client = LangFlowClient("https://langflow.example", transport=transport)
 
     summaries = list(client.iter_flow_summaries(page_size=1))
+    sequential = list(client.iter_flow_summaries(page_size=1, prefetch=False))
 
     assert [summary.flow_id for summary in summaries] == ["one", "two"]
+    assert sequential == summaries
 
+    pool = client._prefetch_pool
+    assert pool is not None
+    client.close()
+    assert client._prefetch_pool is None
+    with pytest.raises(RuntimeError):
+        pool.submit(print)
 
-def test_client_from_settings_requires_base_url(tmp_path: Path) -> None:
-    settings = LF2XSettings(output_dir=tmp_path / "dist")
+
+def test_client_from_settings_requires_base_url(path_root: Path) -> None:
+    settings = LF2XSettings(output_dir=path_root / "dist")
     with pytest.raises(ValueError, match="api_base_url"):
         LangFlowClient.from_settings(settings)
 
     configured = LF2XSettings(
-        output_dir=tmp_path / "dist",
+        output_dir=path_root / "dist",
         api_base_url="https://langflow.example",
         api_token="secret",
     )
-    transport = httpx.MockTransport(lambda request: httpx.Response(200, json=PAYLOAD))
-    client = LangFlowClient.from_settings(configured, transport=transport)
+    client = LangFlowClient.from_settings(configured, transport=_PAYLOAD_TRANSPORT)
 
     client.fetch_flow_json("flow")
 
@@ -165,6 +239,36 @@ def test_flow_summary_requires_identifier() -> None:
         FlowSummary.from_payload({})
 
 
+def test_flow_summary_normalizes_tag_containers() -> None:
+    def tags(value: object) -> tuple[str, ...]:
+        return FlowSummary.from_payload({"id": "flow", "tags": value}).tags
+
+    assert tags({"main": "demo"}) == ("demo",)
+    assert tags(MappingProxyType({"main": "demo"})) == ("demo",)
+    assert tags(["a", 1]) == ("a", "1")
+    assert tags(("a",)) == ("a",)
+    assert tags("demo") == ()
+
+
+def test_flow_summary_tag_subclasses_fall_back_to_isinstance() -> None:
+    class TagDict(dict[str, str]):
+        pass
+
+    class TagList(list[object]):
+        pass
+
+    class TagStr(str):
+        pass
+
+    def tags(value: object) -> tuple[str, ...]:
+        return FlowSummary.from_payload({"id": "flow", "tags": value}).tags
+
+    assert tags(TagDict(main="demo")) == ("demo",)
+    assert tags(TagList([TagStr("a"), 1])) == ("a", "1")
+    assert tags(frozenset({"a"})) == ()
+    assert tags(TagStr("demo")) == ()
+
+
 def test_flow_page_has_more_property() -> None:
     page = FlowPage(
         flows=(FlowSummary(flow_id="one", name="One", tags=()),),
@@ -176,7 +280,7 @@ def test_flow_page_has_more_property() -> None:
     assert not FlowPage(flows=(), total=0, offset=0, limit=1).has_more
 
 
-def test_iter_irs_fetches_all_flows(tmp_path: Path) -> None:
+def test_iter_irs_fetches_all_flows(settings: LF2XSettings) -> None:
     list_payload = {
         "data": [
             {"id": "flow1", "name": "One", "tags": {"main": "demo"}},
@@ -187,12 +291,10 @@ def test_iter_irs_fetches_all_flows(tmp_path: Path) -> None:
 
     def handler(request: httpx.Request) -> httpx.Response:
         if request.url.path.endswith("flows"):
-            if "tags" in request.url.params:
-                assert request.url.params["tags"] == "demo"
+            assert request.url.params.get("tags", "demo") == "demo"
             return httpx.Response(200, json=list_payload)
-        return httpx.Response(200, json=PAYLOAD)
+        return _payload_response(request)
 
-    settings = LF2XSettings(output_dir=tmp_path / "dist")
     transport = httpx.MockTransport(handler)
     client = LangFlowClient("https://langflow.example", transport=transport)
 
@@ -202,22 +304,116 @@ def test_iter_irs_fetches_all_flows(tmp_path: Path) -> None:
     assert ids == [PAYLOAD["id"], PAYLOAD["id"]]
 
 
+def test_client_reuses_one_connection_pool(monkeypatch: pytest.MonkeyPatch) -> None:
+    created: list[httpx.Client] = []
+    closed: list[httpx.Client] = []
+
+    class RecordingClient(httpx.Client):
+        def __init__(self, **kwargs: object) -> None:
+            super().__init__(**kwargs)  # type: ignore[arg-type]
+            created.append(self)
+
+        def close(self) -> None:
+            closed.append(self)
+            super().close()
+
+    monkeypatch.setattr(httpx, "Client", RecordingClient)
+
+    with LangFlowClient("https://langflow.example", transport=_PAYLOAD_TRANSPORT) as client:
+        client.fetch_flow_json("one")
+        client.fetch_flow_json("two")
+
+    assert len(created) == 1
+    assert closed == created
+
+
+def test_fetch_many_returns_documents_in_request_order() -> None:
+    requested: list[str] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        flow_id = request.url.path.rsplit("/", 1)[-1]
+        requested.append(flow_id)
+        return httpx.Response(200, json={**PAYLOAD, "id": flow_id})
+
+    transport = httpx.MockTransport(handler)
+    client = LangFlowClient("https://langflow.example", async_transport=transport)
+
+    documents = client.fetch_many(["a", "b", "c"], concurrency=2)
+
+    assert [document.flow_id for document in documents] == ["a", "b", "c"]
+    assert sorted(requested) == ["a", "b", "c"]
+
+
+def test_fetch_many_rejects_a_running_event_loop() -> None:
+    client = LangFlowClient("https://langflow.example", transport=_PAYLOAD_TRANSPORT)
+
+    async def call_from_loop() -> None:
+        with pytest.raises(RuntimeError, match="active event loop"):
+            client.fetch_many(["flow"])
+
+    asyncio.run(call_from_loop())
+
+
+def test_aiter_flow_documents_pages_through_all_flows() -> None:
+    pages = [
+        {"data": [{"id": "one"}, {"id": "two"}], "pagination": {"total": 3, "offset": 0}},
+        {"data": [{"id": "three"}], "pagination": {"total": 3, "offset": 2}},
+    ]
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("flows"):
+            assert request.url.params["tags"] == "demo"
+            return httpx.Response(200, json=pages[int(request.url.params["offset"]) // 2])
+        return httpx.Response(200, json={**PAYLOAD, "id": request.url.path.rsplit("/", 1)[-1]})
+
+    transport = httpx.MockTransport(handler)
+    client = LangFlowClient("https://langflow.example", async_transport=transport)
+
+    async def collect() -> list[str]:
+        documents = client.aiter_flow_documents(page_size=2, tags=["demo"])
+        return [document.flow_id async for document in documents]
+
+    assert asyncio.run(collect()) == ["one", "two", "three"]
+
+
+def test_async_requests_map_error_statuses() -> None:
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("flows"):
+            return httpx.Response(403)
+        return httpx.Response(404)
+
+    transport = httpx.MockTransport(handler)
+    client = LangFlowClient("https://langflow.example", async_transport=transport)
+
+    with pytest.raises(LangFlowNotFoundError):
+        asyncio.run(client.afetch_flow_document("missing"))
+    with pytest.raises(LangFlowAuthError):
+        asyncio.run(client.alist_flows())
+
+
+# Live tests share one pooled client so the TCP/TLS handshake is paid once per session.
+@pytest.fixture(scope="session")
+def live_settings(tmp_path_factory: pytest.TempPathFactory) -> LF2XSettings:
+    return LF2XSettings(
+        output_dir=tmp_path_factory.mktemp("live") / "dist",
+        api_base_url=os.environ["LF2X_LANGFLOW_BASE_URL"],
+        api_token=os.environ.get("LF2X_LANGFLOW_API_TOKEN"),
+    )
+
+
+@pytest.fixture(scope="session")
+def live_client(live_settings: LF2XSettings) -> Iterator[LangFlowClient]:
+    with LangFlowClient.from_settings(live_settings) as client:
+        yield client
+
+
 @pytest.mark.skipif(  # type: ignore[misc]
     "LF2X_LANGFLOW_BASE_URL" not in os.environ,
     reason="LF2X_LANGFLOW_BASE_URL not set; skipping integration test",
 )
-def test_live_langflow_iter_irs(tmp_path: Path) -> None:
-    base_url = os.environ["LF2X_LANGFLOW_BASE_URL"]
-    token = os.environ.get("LF2X_LANGFLOW_API_TOKEN")
-    settings = LF2XSettings(
-        output_dir=tmp_path / "dist",
-        api_base_url=base_url,
-        api_token=token,
-    )
-    client = LangFlowClient.from_settings(settings)
-
+def test_live_langflow_iter_irs(live_client: LangFlowClient, live_settings: LF2XSettings) -> None:
     try:
-        ir_iterator = client.iter_irs(settings=settings)
+        ir_iterator = live_client.iter_irs(settings=live_settings)
         first = next(ir_iterator, None)
     except (LangFlowAPIError, httpx.HTTPError) as exc:
         pytest.skip(f"LangFlow API unavailable: {exc}")